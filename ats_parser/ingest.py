@@ -1,9 +1,8 @@
 
 from __future__ import annotations
-import os, re, unicodedata
-from typing import Tuple
+import io, os
+from typing import Tuple, Union
 import fitz  # PyMuPDF
-import pdfplumber
 
 USE_OCR = os.getenv("USE_OCR", "0") == "1"
 OCR_LANGS = (os.getenv("OCR_LANGS", "en").split(","))
@@ -11,9 +10,8 @@ OCR_LANGS = (os.getenv("OCR_LANGS", "en").split(","))
 def _norm_ws(s: str) -> str:
     if not s:
         return ""
-    s = s.replace("\ufeff", "")
-    s = "".join(" " if (ch.isspace() or unicodedata.category(ch) == "Zs") else ch for ch in s)
-    return re.sub(r"\s+", " ", s).strip()
+    # str.split() breaks on every isspace() char, which covers all of Zs
+    return " ".join(s.replace("\ufeff", "").split())
 
 def _page_blocks_sorted(page):
     blocks = page.get_text("blocks") or []
@@ -36,9 +34,11 @@ def _get_ocr():
         _ocr_reader = easyocr.Reader(OCR_LANGS, gpu=False)
     return _ocr_reader
 
-def read_pdf_text(path: str) -> Tuple[str, int]:
-    """Return (text, ocr_pages_used). Uses blocks; falls back to text/ocr/pdfplumber."""
-    doc = fitz.open(path)
+def read_pdf_text(path: Union[str, bytes]) -> Tuple[str, int]:
+    """Return (text, ocr_pages_used). Uses blocks; falls back to text/ocr/pdfplumber.
+    path may also be the PDF's bytes (e.g. a fresh upload), read without touching disk."""
+    in_memory = isinstance(path, (bytes, bytearray))
+    doc = fitz.open(stream=path, filetype="pdf") if in_memory else fitz.open(path)
     assembled, ocr_count = [], 0
     for i, page in enumerate(doc):
         raw = _blocks_to_text(_page_blocks_sorted(page)) or (page.get_text("text") or "")
@@ -58,7 +58,8 @@ def read_pdf_text(path: str) -> Tuple[str, int]:
     # rescue with pdfplumber if still sparse
     if len(_norm_ws(text)) < 120:
         try:
-            with pdfplumber.open(path) as pdf:
+            import pdfplumber  # lazy: pdfminer is only needed for sparse PDFs
+            with pdfplumber.open(io.BytesIO(path) if in_memory else path) as pdf:
                 text2 = "\n".join((p.extract_text() or "") for p in pdf.pages)
             if len(_norm_ws(text2)) > len(_norm_ws(text)):
                 text = text2
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
 from typing import List
-import os
-import tempfile
 
 from .models import (
     Resume,
@@ -31,7 +29,7 @@ def _split_name(full: str):
     return parts[0], " ".join(parts[1:-1]), parts[-1]
 
 
-def parse_file(path: str) -> Resume:
+def parse_file(path: str | bytes) -> Resume:
     text, ocr_pages = read_pdf_text(path)
     secs = split_sections(text)
 
@@ -162,17 +160,8 @@ def parse_file(path: str) -> Resume:
 
 
 def parse_bytes(data: bytes) -> Resume:
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-        tmp.write(data)
-        tmp.flush()
-        path = tmp.name
-    try:
-        return parse_file(path)
-    finally:
-        try:
-            os.remove(path)
-        except Exception:
-            pass
+    # read_pdf_text() opens bytes directly; no temp file round trip
+    return parse_file(data)
 
 
 def adapt_for_backend(resume: Resume) -> dict:
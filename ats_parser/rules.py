@@ -1,19 +1,88 @@
 from __future__ import annotations
+import os
 import re
 from typing import List, Tuple
-from datetime import datetime
 import phonenumbers
 import json
+import logging
 from pathlib import Path
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from functools import lru_cache
+from sys import intern
 
+# orjson parses the big compiled allowlist JSON noticeably faster (pip install orjson)
 try:
-    import dateparser
+    import orjson
 except Exception:
-    dateparser = None
+    orjson = None
+
+
+def _load_json(path: Path):
+    # orjson takes the raw bytes: no decode-to-str round trip first
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+# Optional faster engines for the hot module-level patterns:
+#   USE_RE2=1         -> linear-time RE2 (pip install google-re2)
+#   USE_PCRE2=1       -> PCRE2 with JIT (pip install pcre2)
+# and for specific scans:
+#   USE_AHOCORASICK=1 -> Tech: tails via one automaton (pip install pyahocorasick)
+#   USE_HYPERSCAN=1   -> date-line scan in fallback_experience (pip install hyperscan)
+USE_RE2 = os.getenv("USE_RE2", "0") == "1"
+USE_PCRE2 = os.getenv("USE_PCRE2", "0") == "1"
+USE_AHOCORASICK = os.getenv("USE_AHOCORASICK", "0") == "1"
+USE_HYPERSCAN = os.getenv("USE_HYPERSCAN", "0") == "1"
+try:
+    import re2
+except Exception:
+    re2 = None
+try:
+    import pcre2
+except Exception:
+    pcre2 = None
+try:
+    import ahocorasick
+except Exception:
+    ahocorasick = None
+try:
+    import hyperscan
+except Exception:
+    hyperscan = None
+
+
+_LOOKAROUND = re.compile(r"\(\?<?[=!]")
+
+
+def _hot_re(pattern: str, flags: int = 0):
+    """
+    Compile a hot module-level pattern with RE2 / PCRE2-JIT when enabled, else stdlib re.
+    Both expose the re.Pattern API used here (search/match/finditer/sub, named groups).
+    Falls back to re for anything an engine rejects (e.g. RE2 + lookarounds) or flags
+    other than IGNORECASE.
+    """
+    if not (flags & ~re.I):
+        # RE2 has no lookarounds; skip it up front (it logs on every rejected compile)
+        if USE_RE2 and re2 is not None and not _LOOKAROUND.search(pattern):
+            try:
+                return re2.compile(("(?i)" if flags & re.I else "") + pattern)
+            except Exception:
+                pass
+        if USE_PCRE2 and pcre2 is not None:
+            try:
+                return pcre2.compile(
+                    pattern, flags=pcre2.I if flags & re.I else 0, jit=True
+                )
+            except Exception:
+                pass
+    return re.compile(pattern, flags)
+
 
-TECH_LINE_RE = re.compile(r"^\s*(tech|tools|stack)\s*:\s*(.+)\s*$", re.I)
+TECH_LINE_RE = _hot_re(r"^\s*(tech|tools|stack)\s*:\s*(.+)\s*$", re.I)
 
-LOCATION_HINT = re.compile(
+LOCATION_HINT = _hot_re(
     r"\b("
     r"QC|ON|BC|AB|MB|SK|NS|NB|NL|PE|PEI|YT|NT|NU|CA|USA|US|UK|"
     r"Quebec|Ontario|British Columbia|Alberta|Manitoba|Saskatchewan|"
@@ -33,14 +102,33 @@ MONTHS = (
 YEAR = r"(?:19|20)\d{2}"
 NUM_MMYYYY = r"(?:0?[1-9]|1[0-2])[-/\.](?:\d{4})"
 PRESENT = r"(?:Present|Current|Now|Today)"
+# PRESENT as a set for whole-token checks
+_PRESENT_WORDS = frozenset({"present", "current", "now", "today"})
 RANGE_SEP = r"(?:\s*(?:-|–|—|to)\s*)"
 DATE_TOKEN = rf"(?:{MONTHS}\s+{YEAR}|{YEAR}|{NUM_MMYYYY})"
-DATE_RE = re.compile(
+DATE_RE = _hot_re(
     rf"(?P<start>{DATE_TOKEN}){RANGE_SEP}(?P<end>{DATE_TOKEN}|{PRESENT})", re.I
 )
+# Same grammar for text that was lowercased once up front: a case-sensitive scan
+# avoids re.I's per-character case folding (~2x faster on a full resume).
+_DATE_RE_LC = _hot_re(
+    rf"(?P<start>{DATE_TOKEN.lower()}){RANGE_SEP}"
+    rf"(?P<end>{DATE_TOKEN.lower()}|{PRESENT.lower()})"
+)
+# Hyperscan's copy of _DATE_RE_LC: the plain pattern string (no named groups),
+# never the .pattern of a possibly RE2/PCRE2-compiled object
+_DATE_LC_HS_PATTERN = (
+    rf"(?:{DATE_TOKEN.lower()}){RANGE_SEP}(?:{DATE_TOKEN.lower()}|{PRESENT.lower()})"
+)
+_DIGIT_RE = re.compile(r"\d")
 
-BULLET = re.compile(r"^(\s*[-•‣∙·*]\s+)")
-TITLE_HINT = re.compile(
+# Range separators for parse_date_range's no-match fallback, tried in priority
+# order (not leftmost): 'Full-stack Dev – June to Present' must split on ' – '.
+# A handful of `in` scans on a short line beat one regex split here.
+_RANGE_SEPS = (" – ", " — ", " - ", "–", "—", "-", " to ")
+
+BULLET = _hot_re(r"^(\s*[-•‣∙·*]\s+)")
+TITLE_HINT = _hot_re(
     r"\b(senior|sr\.?|jr\.?|junior|lead|principal|staff|head|director|manager|"
     r"engineer|developer|analyst|consultant|architect|intern)\b",
     re.I,
@@ -79,14 +167,14 @@ MONTH_MAP = {
 }
 
 # Degree / school patterns
-DEGREE_HINT = re.compile(
+DEGREE_HINT = _hot_re(
     r"\b("
     r"(?:bachelo[u]?r|master|msc|ma|mba|m\.?eng|b\.?sc|b\.?eng|ph\.?d|phd|doctoral|doctorate|"
     r"diploma|degree|certificat(?:e)?|dec|d\.?e\.?c|high\s+school|secondary|college\s+studies)"
     r")\b",
     re.I,
 )
-SCHOOL_SUFFIX = re.compile(
+SCHOOL_SUFFIX = _hot_re(
     r"\b(universit(?:y|é)|university|college|school|institute|academy|polytechnique|école)\b",
     re.I,
 )
@@ -172,11 +260,23 @@ _SOFT_SKILLS_IGNORE = {
     "creativity",
 }
 
-_SKILL_PATTERNS = [
-    (canon, re.compile("|".join(frags), re.I)) for canon, frags in _SKILL_CANON.items()
-]
+# One alternation over every lexicon fragment: a single scan finds the leftmost hit
+# (or rejects the token). Kept capture-free so re can use its fast prefix scan.
+_SKILL_ANY = _hot_re(
+    "|".join(f for frags in _SKILL_CANON.values() for f in frags), re.I
+)
+# Same alternation with one named group per canonical label; only ever anchored at
+# the position _SKILL_ANY found, so m.lastgroup ("g<i>") identifies the label. The
+# name, not m.lastindex, so a capturing group inside a fragment can't shift labels.
+_SKILL_UNION = _hot_re(
+    "|".join(
+        f"(?P<g{i}>{'|'.join(frags)})" for i, frags in enumerate(_SKILL_CANON.values())
+    ),
+    re.I,
+)
+_GROUP_TO_CANON = {f"g{i}": canon for i, canon in enumerate(_SKILL_CANON)}
 
-SKILLS_HEAD = re.compile(
+SKILLS_HEAD = _hot_re(
     r"^(skills?|technical skills?|technologies|tools|tooling|"
     r"tech(?:nical)?(?:\s+stack)?|stack|"
     r"proficiencies|expertise|core (?:skills|competencies)|competenc(?:y|ies)|"
@@ -184,16 +284,33 @@ SKILLS_HEAD = re.compile(
     r"software|platforms|databases)\b[:\-–—]?",
     re.I,
 )
-NEXT_SECTION_HEAD = re.compile(
+NEXT_SECTION_HEAD = _hot_re(
     r"^(experience|work (?:history|experience)|employment|projects?|education|languages?|certifications?)\b",
     re.I,
 )
 
 
+@lru_cache(maxsize=4096)
+def _lexicon_canon(tok: str) -> str | None:
+    """Leftmost lexicon hit in tok -> canonical skill label (None if no hit)."""
+    m = _SKILL_ANY.search(tok or "")
+    if not m:
+        return None
+    g = _SKILL_UNION.match(tok, m.start())
+    return _GROUP_TO_CANON[g.lastgroup] if g else None
+
+
 def norm(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip())
+    # same result as re.sub(r"\s+", " ", s.strip()), without the regex engine.
+    # Fast path for already-clean text: every whitespace char except " " is
+    # non-printable, so printable + no double/edge spaces means nothing to do.
+    s = s or ""
+    if s.isprintable() and "  " not in s and s[:1] != " " and s[-1:] != " ":
+        return s
+    return " ".join(s.split())
 
 
+@lru_cache(maxsize=4096)
 def _looks_like_location(s: str) -> bool:
     s = norm(s)
     if not s:
@@ -213,37 +330,57 @@ def parse_date_range(s: str):
       - 'June – Sept 2006'   (borrow year from the other side)
       - '06/2006 – 09/2006'
     """
-    txt = (s or "").strip()
+    # cache on the stripped text so padded/None variants share one entry
+    return _parse_date_range_cached((s or "").strip())
 
-    # 1) Try the existing broad regex first (Month Year | Year | mm/yyyy)
-    m = DATE_RE.search(txt)
 
-    def to_ym(tok: str):
-        if not tok:
-            return None
-        if re.fullmatch(PRESENT, tok, re.I):
-            return "Present"
-        if re.fullmatch(YEAR, tok):
-            return f"{tok}-01"
-        mm = re.match(r"(0?[1-9]|1[0-2])[-/\.]([0-9]{4})", tok)
-        if mm:
-            return f"{mm.group(2)}-{int(mm.group(1)):02d}"
-        mn, yr = _find_month(tok), _find_year(tok)
-        if mn and yr:
-            return f"{yr}-{mn:02d}"
+@lru_cache(maxsize=4096)
+def _parse_date_range_cached(txt: str):
+    # 1) Try the existing broad regex first (Month Year | Year | mm/yyyy).
+    # Every DATE_TOKEN has a 4-digit run, so digit-free text is rejected without
+    # running the grammar; otherwise the lowercase grammar stands in for re.I.
+    m = _DATE_RE_LC.search(txt.lower()) if _DIGIT_RE.search(txt) else None
+    return _parse_date_range(txt, m)
+
+
+_MMYYYY_RE = re.compile(r"(0?[1-9]|1[0-2])[-/\.]([0-9]{4})")
+
+
+@lru_cache(maxsize=4096)
+def _to_ym(tok: str):
+    """One DATE_RE token ('Jun 2006', '2006', '06/2006', 'Present') -> 'YYYY-MM'."""
+    if not tok:
+        return None
+    if tok.lower() in _PRESENT_WORDS:
+        return "Present"
+    if len(tok) == 4 and tok[:2] in ("19", "20") and tok[2:].isdecimal():
+        return f"{tok}-01"
+    mm = _MMYYYY_RE.match(tok)
+    if mm:
+        return f"{mm.group(2)}-{int(mm.group(1)):02d}"
+    # numeric paths are done; without letters there is no month name to find
+    if not any(c.isalpha() for c in tok):
         return None
+    mn, yr = _find_month(tok), _find_year(tok)
+    if mn and yr:
+        return f"{yr}-{mn:02d}"
+    return None
+
 
+def _parse_date_range(txt: str, m):
+    """parse_date_range() body; m is DATE_RE's match for txt (or None), so callers
+    that already scanned for dates can pass their match instead of re-searching."""
     if m:
         start_tok, end_tok = m.group("start"), m.group("end")
-        s_norm = to_ym(start_tok)
+        s_norm = _to_ym(start_tok)
         e_norm = (
-            "Present" if re.fullmatch(PRESENT, end_tok or "", re.I) else to_ym(end_tok)
+            "Present" if (end_tok or "").lower() in _PRESENT_WORDS else _to_ym(end_tok)
         )
     else:
         # 2) Fallback for 'June – Sept 2006' etc.
         s_norm = e_norm = None
         left = right = None
-        for sep in [" – ", " — ", " - ", "–", "—", "-", " to "]:
+        for sep in _RANGE_SEPS:
             if sep in txt:
                 left, right = txt.split(sep, 1)
                 left, right = left.strip(), right.strip()
@@ -253,7 +390,7 @@ def parse_date_range(s: str):
 
         ly, lm = _find_year(left), _find_month(left)
         ry, rm = _find_year(right), _find_month(right)
-        right_present = bool(re.fullmatch(PRESENT, right, re.I))
+        right_present = right.lower() in _PRESENT_WORDS
 
         # borrow year from the other side when only one side has it
         if lm and not ly and ry is not None:
@@ -286,25 +423,50 @@ def parse_date_range(s: str):
     return s_norm, e_norm, months
 
 
+# cheap digit-run gate before phonenumbers (which normalizes all the text it's given).
+# The separator class mirrors phonenumbers' own punctuation set: Word/PDF text often
+# writes numbers with en dashes (U+2013) or non-breaking hyphens (U+2011).
+_PHONE_CAND = re.compile(
+    r"[+\uff0b]?[(\uff08]?\d"
+    r"[\d\s().\-/~\[\]\u00ad\u200b\u2060\u2010-\u2015\u2212\u2053\u223c\u30fc"
+    r"\uff08\uff09\uff0d-\uff0f\uff3b\uff3d\uff5e]{7,}\d"
+)
+
+
+def _first_phone(text: str):
+    """First phone PhoneNumberMatcher finds, run only on lines holding a digit run."""
+    scanned_to = -1
+    for c in _PHONE_CAND.finditer(text):
+        if c.start() < scanned_to:
+            continue
+        # hand the matcher the whole line(s) so its context checks still apply
+        ls = text.rfind("\n", 0, c.start()) + 1
+        le = text.find("\n", c.end())
+        scanned_to = le = len(text) if le < 0 else le
+        for m in phonenumbers.PhoneNumberMatcher(text[ls:le], "CA"):
+            return phonenumbers.format_number(
+                m.number, phonenumbers.PhoneNumberFormat.INTERNATIONAL
+            )
+    return None
+
+
+_TITLE_TOK_RE = re.compile(r"[A-Z][a-zA-Z-]+")
+
+
 def extract_contacts(text: str) -> dict:
     emails = EMAIL.findall(text) or []
     links = list(dict.fromkeys(LINK.findall(text)))[:5]
-    phone = None
-    for m in phonenumbers.PhoneNumberMatcher(text, "CA"):
-        phone = phonenumbers.format_number(
-            m.number, phonenumbers.PhoneNumberFormat.INTERNATIONAL
-        )
-        break
+    phone = _first_phone(text)
     # naive name guess: first line with 2-4 TitleCased tokens
     name = ""
     for ln in text.splitlines()[:12]:
         s = norm(ln)
         if not s or len(s) > 60:
             continue
-        if any(ch.isdigit() for ch in s):
+        if _DIGIT_RE.search(s):
             continue
-        toks = [t for t in s.split() if re.match(r"^[A-Z][a-zA-Z-]+$", t)]
-        if 2 <= len(toks) <= 4:
+        n_title = sum(1 for t in s.split() if _TITLE_TOK_RE.fullmatch(t))
+        if 2 <= n_title <= 4:
             name = s
             break
     return {
@@ -315,6 +477,7 @@ def extract_contacts(text: str) -> dict:
     }
 
 
+@lru_cache(maxsize=4096)
 def _looks_like_title(s: str) -> bool:
     s = norm(s)
     if not s or s.endswith("."):
@@ -330,12 +493,13 @@ def _looks_like_title(s: str) -> bool:
     return caps / len(toks) >= 0.6 and len(toks) <= 7
 
 
-VERB_HINT = re.compile(
+VERB_HINT = _hot_re(
     r"\b(built|designed|developed|managed|led|mentored|supported|created|owned|implemented|improved|analyzed|wrote|drove|delivered)\b",
     re.I,
 )
 
 
+@lru_cache(maxsize=4096)
 def _looks_like_company(s: str) -> bool:
     s = norm(s)
     if not s or s.lower().startswith(("http://", "https://", "www.")):
@@ -353,7 +517,7 @@ def _looks_like_company(s: str) -> bool:
 
 
 def _guess_title_company_from_buffer(buf: list[str]) -> tuple[str, str]:
-    window = [norm(x) for x in buf if norm(x)][-6:]
+    window = [n for n in map(norm, buf) if n][-6:]
     title, company = "", ""
     for i in range(len(window) - 1, -1, -1):
         if _looks_like_company(window[i]):
@@ -376,6 +540,70 @@ def _guess_title_company_from_buffer(buf: list[str]) -> tuple[str, str]:
     return title, company
 
 
+@lru_cache(maxsize=None)
+def _date_hs_db():
+    """Hyperscan block-mode database for the date grammar (USE_HYPERSCAN=1), else None."""
+    if not (USE_HYPERSCAN and hyperscan is not None):
+        return None
+    try:
+        db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        db.compile(
+            expressions=[_DATE_LC_HS_PATTERN.encode()],
+            ids=[0],
+            elements=1,
+            flags=[hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP],
+        )
+        return db
+    except Exception:
+        # cached, so this is logged once; scans fall back to re
+        logging.getLogger(__name__).warning(
+            "USE_HYPERSCAN=1 but the date database failed to compile; using re",
+            exc_info=True,
+        )
+        return None
+
+
+def _scan_date_lines(lines: list[str]) -> dict[int, re.Match]:
+    r"""
+    First date-range match per line, keyed by line index, from one pass over the
+    whole block instead of a search per line. NUL joins the lines so no match can
+    span two of them (\s would cross "\n").
+    """
+    hits: dict[int, re.Match] = {}
+    joined = "\x00".join(lines)
+    joined_lc = joined.lower()
+
+    db = _date_hs_db()
+    if db is not None:
+        # SIMD scan only tags the lines; re then extracts groups on those lines
+        buf = joined_lc.encode("utf-8")
+        nul_at = [m.start() for m in re.finditer(b"\x00", buf)]
+        tagged: set[int] = set()
+
+        def on_match(_id, _start, end, _flags, _ctx):
+            tagged.add(bisect_right(nul_at, end - 1))
+
+        db.scan(buf, match_event_handler=on_match)
+        for i in sorted(tagged):
+            m = _DATE_RE_LC.search(lines[i].lower())
+            if m:
+                hits[i] = m
+        return hits
+
+    line_starts, pos = [], 0
+    for l in lines:
+        line_starts.append(pos)
+        pos += len(l) + 1
+    # offsets only line up if lower() kept the length (a few non-ASCII chars grow)
+    if len(joined_lc) == len(joined):
+        date_scan = _DATE_RE_LC.finditer(joined_lc)
+    else:
+        date_scan = DATE_RE.finditer(joined)
+    for m in date_scan:
+        hits.setdefault(bisect_right(line_starts, m.start()) - 1, m)
+    return hits
+
+
 def fallback_experience(text_or_lines) -> list[dict]:
     """
     Heuristic EXPERIENCE extractor.
@@ -385,18 +613,17 @@ def fallback_experience(text_or_lines) -> list[dict]:
     - Support Tech/Tools/Stack lines inside an experience block.
     - In tech allowlist mode: only keep allowlisted technologies (drop unknown tokens).
     """
-    lines = [
-        norm(l)
-        for l in (
-            text_or_lines
-            if isinstance(text_or_lines, list)
-            else (text_or_lines or "").splitlines()
-        )
-        if norm(l)
-    ]
+    src = (
+        text_or_lines
+        if isinstance(text_or_lines, list)
+        else (text_or_lines or "").splitlines()
+    )
+    lines = [n for n in map(norm, src) if n]
+    date_hits = _scan_date_lines(lines)
 
     # Tech allowlist (dynamic)
-    tech_allow_enabled, tech_canon_by_key, tech_alias_to_canon = _load_compiled_tech_allowlists()
+    tech_allow_enabled, tech_lookup = _tech_lookup()
+    tech_ac = _tech_automaton()
 
     def _add_unique(found: list[str], seen: set[str], value: str):
         k = (value or "").casefold()
@@ -407,6 +634,8 @@ def fallback_experience(text_or_lines) -> list[dict]:
     def _extract_tech_from_tail(tail: str) -> list[str]:
         if not tail:
             return []
+        if tech_allow_enabled and tech_ac is not None:
+            return _scan_tech_ac(tech_ac, tail)
         toks = []
         for tok in _split_on_separators(tail):
             t = (tok or "").strip()
@@ -414,8 +643,7 @@ def fallback_experience(text_or_lines) -> list[dict]:
                 continue
 
             if tech_allow_enabled:
-                key = _norm_key(t)
-                canon = tech_alias_to_canon.get(key) or tech_canon_by_key.get(key)
+                canon = tech_lookup.get(_norm_key(t))
                 if canon:
                     toks.append(canon)
             else:
@@ -424,38 +652,37 @@ def fallback_experience(text_or_lines) -> list[dict]:
                     toks.append(t)
         return toks
 
-    def gather_desc(start_idx: int, n: int):
+    # Tag every line once: (is_bullet, text without bullet, Tech:/Tools: match).
+    # gather_desc and the description loop below both read these.
+    tags = []
+    for s in lines:
+        mb = BULLET.match(s)
+        body = (s[mb.end() :] if mb else s).strip()
+        tags.append((mb is not None, body, TECH_LINE_RE.match(body)))
+
+    def gather_desc(start_idx: int, n: int) -> int:
         """
-        Collect lines belonging to the current experience item.
+        Find the end of the description lines belonging to the current item
+        (lines[start_idx:returned index]).
 
         Important behavior:
         - Always keep bullet lines (do not treat as title/company boundaries).
         - Always keep tech lines (Tech:/Tools:/Stack:) so we can parse technologies.
         - Stop on the next date line or a clear new header line.
         """
-        buf, j = [], start_idx
+        j = start_idx
         while j < n:
-            s = lines[j]
-
             # next item begins
-            if DATE_RE.search(s):
+            if j in date_hits:
                 break
 
-            # strip bullet prefix ONLY for checking tech label
-            s_no_bullet = BULLET.sub("", s).strip()
-
-            # keep tech lines even if they look "header-ish"
-            if TECH_LINE_RE.match(s_no_bullet):
-                buf.append(s)
-                j += 1
-                continue
-
-            # keep bullet lines
-            if BULLET.match(s):
-                buf.append(s)
+            is_bullet, _body, mtech = tags[j]
+            # keep tech lines even if they look "header-ish", and bullet lines
+            if mtech or is_bullet:
                 j += 1
                 continue
 
+            s = lines[j]
             # stop when the next header-ish line begins (title/company)
             if _looks_like_title(s) or _looks_like_company(s):
                 break
@@ -464,22 +691,23 @@ def fallback_experience(text_or_lines) -> list[dict]:
             if len(s) > 110:
                 break
 
-            buf.append(s)
             j += 1
 
-        return buf, j
+        return j
 
-    items, i, n = [], 0, len(lines)
+    items: dict[tuple, dict] = {}
+    i, n = 0, len(lines)
 
     while i < n:
         line = lines[i]
 
         # we anchor items on a date-range line
-        if not DATE_RE.search(line):
+        m = date_hits.get(i)
+        if not m:
             i += 1
             continue
 
-        start, end, months = parse_date_range(line)
+        start, end, months = _parse_date_range(line, m)
         title, company, forward_used = "", "", False
 
         # Prefer forward look (date line followed by title/company line)
@@ -500,21 +728,15 @@ def fallback_experience(text_or_lines) -> list[dict]:
 
         # Description starts after any forward-used line(s)
         desc_start = i + (2 if forward_used else 1)
-        desc_lines, stop = gather_desc(desc_start, n)
+        stop = gather_desc(desc_start, n)
 
         bullets: list[str] = []
         technologies: list[str] = []
         tech_seen: set[str] = set()
 
-        for raw in desc_lines:
-            s = norm(raw)
-            if not s:
-                continue
-
+        for k in range(desc_start, stop):
             # allow "- Tech: ..." too
-            s_no_bullet = BULLET.sub("", s).strip()
-
-            mtech = TECH_LINE_RE.match(s_no_bullet)
+            is_bullet, body, mtech = tags[k]
             if mtech:
                 # TECH_LINE_RE = r"^(tech|technologies|tools|stack|frameworks)\s*:\s*(.+)$"
                 tail = mtech.group(2) or ""
@@ -523,18 +745,20 @@ def fallback_experience(text_or_lines) -> list[dict]:
                 continue
 
             # bullets
-            if BULLET.match(s):
-                b = BULLET.sub("", s).strip()
-                if b:
-                    bullets.append(b)
+            if is_bullet:
+                if body:
+                    bullets.append(body)
             else:
                 # treat short non-header lines as bullet-like description
-                if 0 < len(s) <= 200:
+                s = lines[k]
+                if len(s) <= 200:
                     bullets.append(s)
 
         if title or company or bullets or technologies:
-            items.append(
-                {
+            # de-dupe as we go: first item per (company, title, start, end) wins
+            key = (company.lower(), title.lower(), start, end)
+            if key not in items:
+                items[key] = {
                     "title": title,
                     "company": company,
                     "location": "",
@@ -543,24 +767,10 @@ def fallback_experience(text_or_lines) -> list[dict]:
                     "technologies": technologies,
                     "confidence": 0.6 if (title or company) else 0.55,
                 }
-            )
 
         i = max(i + 1, stop)
 
-    # de-dupe items
-    seen, uniq = set(), []
-    for it in items:
-        key = (
-            (it.get("company") or "").lower(),
-            (it.get("title") or "").lower(),
-            (it.get("dates") or {}).get("start"),
-            (it.get("dates") or {}).get("end"),
-        )
-        if key not in seen:
-            seen.add(key)
-            uniq.append(it)
-
-    return uniq
+    return list(items.values())
 
 
 
@@ -577,6 +787,7 @@ def _split_school_location(s: str) -> tuple[str, str]:
     return s, ""
 
 
+@lru_cache(maxsize=4096)
 def _looks_like_school_line(s: str) -> bool:
     s = norm(s)
     # Require an explicit school keyword to avoid job titles being misread
@@ -588,18 +799,24 @@ def _looks_like_school_line(s: str) -> bool:
     return False
 
 
+_YEAR_RE = re.compile(r"\b(19|20)\d{2}\b")
+
+
+@lru_cache(maxsize=4096)
 def _find_year(tok: str):
-    m = re.search(r"\b(19|20)\d{2}\b", tok or "")
+    m = _YEAR_RE.search(tok or "")
     return int(m.group(0)) if m else None
 
 
+_MONTH_RE = re.compile(
+    r"\b(" + "|".join(sorted(MONTH_MAP, key=len, reverse=True)) + r")\b", re.I
+)
+
+
+@lru_cache(maxsize=4096)
 def _find_month(tok: str):
-    t = (tok or "").lower()
-    t = re.sub(r"[:;.,]+$", "", t)
-    for k, v in MONTH_MAP.items():
-        if re.search(rf"\b{k}\b", t):
-            return v
-    return None
+    m = _MONTH_RE.search(tok or "")
+    return MONTH_MAP[m.group(1).lower()] if m else None
 
 
 _AT_SPLIT = re.compile(r"\s+(?:at|@)\s+", re.I)
@@ -646,15 +863,12 @@ def fallback_education(text_or_lines) -> list[dict]:
     Also merges cases where the degree is on one line and the school/dates
     are on the next lines, so we emit *one* item per education.
     """
-    lines = [
-        norm(l)
-        for l in (
-            text_or_lines
-            if isinstance(text_or_lines, list)
-            else (text_or_lines or "").splitlines()
-        )
-        if norm(l)
-    ]
+    src = (
+        text_or_lines
+        if isinstance(text_or_lines, list)
+        else (text_or_lines or "").splitlines()
+    )
+    lines = [n for n in map(norm, src) if n]
 
     items, i, n = [], 0, len(lines)
 
@@ -750,30 +964,49 @@ def fallback_education(text_or_lines) -> list[dict]:
     return merged
 
 
+# brackets | version numbers | filler words, blanked in one pass by _clean_skill_token
+_CLEAN_RE = re.compile(
+    r"[\(\)\[\]\{\}]"
+    r"|\b(?:version|v?\d+(?:\.\d+){0,2})\b"
+    r"|\b(?:and|with|using|experience in|proficient in|familiar with)\b",
+    re.I,
+)
+
+
 def _clean_skill_token(s: str) -> str:
     # strip bullets and brackets, keep tech punctuation like + # . -
     s = BULLET.sub("", s or "")
-    s = re.sub(r"[\(\)\[\]\{\}]", " ", s)
-    s = re.sub(r"\b(version|v?\d+(\.\d+){0,2})\b", " ", s, flags=re.I)
-    s = re.sub(
-        r"\b(and|with|using|experience in|proficient in|familiar with)\b",
-        " ",
-        s,
-        flags=re.I,
-    )
-    return norm(s)
+    return norm(_CLEAN_RE.sub(" ", s))
+
+
+_AND_SPLIT_RE = re.compile(r"\sand\s", re.I)
 
 
 def _split_on_separators(blob: str) -> list[str]:
-    # split on commas, semicolons, pipes, slashes and bullets
-    parts = re.split(r"[,;/|•·●◦•\u2022]+", blob)
+    # split on commas, semicolons, pipes, slashes and bullets: fold them all to ","
+    # with C-level replaces, then one split (runs just leave empty parts, skipped)
+    blob = (
+        blob.replace(";", ",")
+        .replace("/", ",")
+        .replace("|", ",")
+        .replace("•", ",")
+        .replace("·", ",")
+        .replace("●", ",")
+        .replace("◦", ",")
+    )
     out = []
-    for p in parts:
+    for p in blob.split(","):
         p = _clean_skill_token(p)
-        if p:
-            # also split "X and Y" occasionally
-            subparts = re.split(r"\sand\s", p, flags=re.I)
-            out.extend(norm(sp) for sp in subparts if norm(sp))
+        if not p:
+            continue
+        # also split "X and Y" occasionally (p is normalized: single spaces only)
+        if " and " not in p.lower():
+            out.append(p)
+            continue
+        for sp in _AND_SPLIT_RE.split(p):
+            sp = norm(sp)
+            if sp:
+                out.append(sp)
     return out
 
 
@@ -782,8 +1015,10 @@ def _split_on_separators(blob: str) -> list[str]:
 _ALLOWLIST_CACHE = None
 
 
+# allowlist keys + resume tokens; the same tokens recur across resumes in a batch
+@lru_cache(maxsize=65536)
 def _norm_key(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip()).casefold()
+    return norm(s).casefold()
 
 
 def _load_compiled_allowlists():
@@ -813,13 +1048,7 @@ def _load_compiled_allowlists():
     allow_items: list[str] = []
     for p in (tech_allow, skills_allow):
         try:
-            allow_items.extend(
-                [
-                    ln.strip()
-                    for ln in p.read_text(encoding="utf-8").splitlines()
-                    if ln.strip()
-                ]
-            )
+            allow_items.extend(_read_allowlist_values(p))
         except Exception:
             # Fail safe: do not break parsing if allowlist reading fails
             _ALLOWLIST_CACHE = (False, {}, {})
@@ -831,13 +1060,13 @@ def _load_compiled_allowlists():
         _ALLOWLIST_CACHE = (False, {}, {})
         return _ALLOWLIST_CACHE
 
-    canon_by_key = {_norm_key(x): x for x in allow_items}
+    canon_by_key = {intern(_norm_key(x)): intern(x) for x in allow_items}
 
     alias_to_canon = {}
     for ap in (tech_aliases, skills_aliases):
         if ap.exists():
             try:
-                m = json.loads(ap.read_text(encoding="utf-8"))
+                m = _load_json(ap)
                 # keys in your compiled json are already lower-ish, but normalize anyway
                 for k, v in (m or {}).items():
                     kk = _norm_key(k)
@@ -846,7 +1075,7 @@ def _load_compiled_allowlists():
                         continue
                     # Only accept aliases that resolve to an allowed canonical term
                     if _norm_key(vv) in canon_by_key:
-                        alias_to_canon[kk] = canon_by_key[_norm_key(vv)]
+                        alias_to_canon[intern(kk)] = canon_by_key[_norm_key(vv)]
             except Exception:
                 # ignore alias loading failures; allowlist-only still works via canon_by_key
                 pass
@@ -855,6 +1084,23 @@ def _load_compiled_allowlists():
     return _ALLOWLIST_CACHE
 
 
+# extract_skills' three "end of SKILLS block" signals in one scan over the
+# lowercased line: a date range, another section's name, or (long lines only)
+# a narrative verb. The group that matched says which one fired.
+_SKILLS_STOP_RE = _hot_re(
+    rf"(?P<date>(?:{DATE_TOKEN.lower()}){RANGE_SEP}"
+    rf"(?:{DATE_TOKEN.lower()}|{PRESENT.lower()}))"
+    r"|(?P<section>\b(?:education|experience|projects?|languages?|certifications?)\b)"
+    r"|(?P<verb>\b(?:built|designed|developed|managed|worked|implemented|created)\b)"
+)
+# extract_skills_from_text's variant (no "worked")
+_BLOCK_END_VERB_RE = re.compile(
+    r"\b(built|designed|developed|managed|implemented|created)\b", re.I
+)
+_TRAILING_NOISE_RE = re.compile(r"\s+(framework|library|stack|lang(uage)?)\b", re.I)
+_LABEL_PAREN_RE = re.compile(r"\s*\([^)]*\)\s*$")
+
+
 def extract_skills(lines: list[str]) -> list[str]:
     """
     English-only skills extractor from the SKILLS section.
@@ -864,24 +1110,24 @@ def extract_skills(lines: list[str]) -> list[str]:
     - If compiled allowlists are present and big enough: allowlist-only mode (no unknown tokens).
     - Otherwise: keep legacy heuristic fallback (so dev still works without the dataset).
     """
-    skills_enabled, skills_canon_by_key, skills_alias_to_canon = (
-        _load_compiled_allowlists()
-    )
-    tech_enabled, tech_canon_by_key, tech_alias_to_canon = (
-        _load_compiled_tech_allowlists()
-    )
+    return _extract_skills(n for n in map(norm, lines or []) if n)
 
-    allow_enabled = bool(skills_enabled or tech_enabled)
 
-    def add_skill(found: list[str], seen: set[str], value: str):
-        k = value.casefold()
-        if k not in seen:
-            seen.add(k)
-            found.append(value)
+def _extract_skills(lines) -> list[str]:
+    """extract_skills() body; lines must already be norm()'d and non-empty."""
+    skills_enabled = _load_compiled_allowlists()[0]
+    allow_enabled = bool(skills_enabled or TECH_ALLOWLIST_ENABLED)
+
+    # casefold -> first label seen; dicts keep insertion order, so one hash op
+    # both de-dupes and records the output order
+    found: dict[str, str] = {}
+
+    def add_skill(value: str):
+        found.setdefault(value.casefold(), value)
 
     def simplify_label(label: str) -> str:
         # Strip trailing parenthetical: "Python (computer programming)" -> "Python"
-        return re.sub(r"\s*\([^)]*\)\s*$", "", (label or "").strip()).strip()
+        return _LABEL_PAREN_RE.sub("", (label or "").strip()).strip()
 
     def display_label(tok: str, canon: str) -> str:
         """
@@ -902,51 +1148,18 @@ def extract_skills(lines: list[str]) -> list[str]:
 
         return canon_clean
 
-    # Load alias conflicts (skills only)
-    alias_conflicts: set[str] = set()
     if allow_enabled:
-        cached = getattr(extract_skills, "_alias_conflicts_cache", None)
-        if cached is None:
-            try:
-                from pathlib import Path
-                import json
-
-                root = Path(__file__).resolve().parent.parent
-                p = root / "compiled" / "skills_alias_conflicts.json"
-                if p.exists():
-                    data = json.loads(p.read_text(encoding="utf-8"))
-                    if isinstance(data, dict):
-                        alias_conflicts = {str(k) for k in data.keys()}
-                    elif isinstance(data, list):
-                        tmp = set()
-                        for x in data:
-                            if isinstance(x, str):
-                                tmp.add(x)
-                            elif isinstance(x, dict) and "alias" in x:
-                                tmp.add(str(x["alias"]))
-                        alias_conflicts = tmp
-            except Exception:
-                alias_conflicts = set()
-            setattr(extract_skills, "_alias_conflicts_cache", alias_conflicts)
-        else:
-            alias_conflicts = cached
+        lookup = _skills_lookup()
+        alias_conflicts = _skills_alias_conflicts()
 
     # 1) Keep only the SKILLS block (stop on dates/long sentences/other sections)
     buf: list[str] = []
-    for l in lines or []:
-        s = norm(l)
-        if not s:
-            continue
-        if DATE_RE.search(s):
-            break
-        if re.search(
-            r"\b(education|experience|projects?|languages?|certifications?)\b", s, re.I
-        ):
-            break
-        if len(s) > 100 and re.search(
-            r"\b(built|designed|developed|managed|worked|implemented|created)\b",
-            s,
-            re.I,
+    for s in lines:
+        long_line = len(s) > 100
+        # a verb on a short line isn't a stop; keep scanning past it
+        if any(
+            long_line or m.lastgroup != "verb"
+            for m in _SKILLS_STOP_RE.finditer(s.lower())
         ):
             break
         buf.append(s)
@@ -956,58 +1169,32 @@ def extract_skills(lines: list[str]) -> list[str]:
     for line in buf:
         tokens.extend(_split_on_separators(line))
 
-    found: list[str] = []
-    seen: set[str] = set()
-
     # --- Allowlist-only mode ---
     if allow_enabled:
         for tok in tokens:
-            low = tok.lower()
-            if low in _SOFT_SKILLS_IGNORE:
-                continue
-
             key = _norm_key(tok)
-
-            # Prefer TECH allowlist (clean labels)
-            tech_canon = tech_alias_to_canon.get(key) or tech_canon_by_key.get(key)
-            if tech_canon:
-                add_skill(found, seen, display_label(tok, tech_canon))
+            if key in _SOFT_SKILLS_IGNORE:
                 continue
 
-            # Skills allowlist (skip conflicting aliases)
-            if key in alias_conflicts:
+            # one probe: tech (clean labels) wins over skills; skills conflicts excluded
+            canon = lookup.get(key)
+            if canon:
+                add_skill(display_label(tok, canon))
                 continue
 
-            skills_canon = skills_alias_to_canon.get(key) or skills_canon_by_key.get(
-                key
-            )
-            if skills_canon:
-                add_skill(found, seen, display_label(tok, skills_canon))
+            # conflicting skills alias: don't second-guess it via the lexicon either
+            if key in alias_conflicts:
                 continue
 
             # Optional: lexicon only if it resolves via allowlists
-            for lex_canon, rx in _SKILL_PATTERNS:
-                if rx.search(tok):
-                    lk = _norm_key(lex_canon)
-
-                    tech_canon2 = tech_alias_to_canon.get(lk) or tech_canon_by_key.get(
-                        lk
-                    )
-                    if tech_canon2:
-                        add_skill(found, seen, display_label(lex_canon, tech_canon2))
-                        break
-
-                    if lk in alias_conflicts:
-                        break
-
-                    skills_canon2 = skills_alias_to_canon.get(
-                        lk
-                    ) or skills_canon_by_key.get(lk)
-                    if skills_canon2:
-                        add_skill(found, seen, display_label(lex_canon, skills_canon2))
-                    break
+            lex_canon = _lexicon_canon(tok)
+            if not lex_canon:
+                continue
+            canon2 = lookup.get(_norm_key(lex_canon))
+            if canon2:
+                add_skill(display_label(lex_canon, canon2))
 
-        return found[:100]
+        return list(found.values())[:100]
 
     # --- Fallback mode (no dataset present) ---
     for tok in tokens:
@@ -1015,27 +1202,68 @@ def extract_skills(lines: list[str]) -> list[str]:
         if low in _SOFT_SKILLS_IGNORE:
             continue
 
-        matched = False
-        for canon, rx in _SKILL_PATTERNS:
-            if rx.search(tok):
-                add_skill(found, seen, canon)
-                matched = True
-                break
-        if matched:
+        canon = _lexicon_canon(tok)
+        if canon:
+            add_skill(canon)
             continue
 
         if 1 <= len(tok.split()) <= 3 and not tok.endswith("."):
-            tok2 = re.sub(
-                r"\s+(framework|library|stack|lang(uage)?)\b", "", tok, flags=re.I
-            ).strip()
+            tok2 = _TRAILING_NOISE_RE.sub("", tok).strip()
             if tok2:
-                add_skill(found, seen, tok2)
+                add_skill(tok2)
+
+    return list(found.values())[:100]
+
+
+@lru_cache(maxsize=None)
+def _skills_alias_conflicts() -> frozenset[str]:
+    """Skills aliases flagged as ambiguous at build time (compiled/skills_alias_conflicts.json)."""
+    try:
+        root = Path(__file__).resolve().parent.parent
+        p = root / "compiled" / "skills_alias_conflicts.json"
+        if not p.exists():
+            return frozenset()
+        data = _load_json(p)
+        if isinstance(data, dict):
+            return frozenset(str(k) for k in data.keys())
+        if isinstance(data, list):
+            tmp = set()
+            for x in data:
+                if isinstance(x, str):
+                    tmp.add(x)
+                elif isinstance(x, dict) and "alias" in x:
+                    tmp.add(str(x["alias"]))
+            return frozenset(tmp)
+    except Exception:
+        pass
+    return frozenset()
+
 
-    return found[:100]
+@lru_cache(maxsize=None)
+def _skills_lookup() -> dict[str, str]:
+    """
+    extract_skills' allowlist tables merged into one key -> canon dict, in the old
+    probe order: tech alias > tech canon > skills alias > skills canon, with
+    conflicting skills aliases left out. One .get() per token instead of four.
+    """
+    _enabled, skills_canon_by_key, skills_alias_to_canon = _load_compiled_allowlists()
+    conflicts = _skills_alias_conflicts()
+    lookup: dict[str, str] = {}
+    # lowest priority first; later updates win
+    for table, skip in (
+        (skills_canon_by_key, conflicts),
+        (skills_alias_to_canon, conflicts),
+        (TECH_ALLOWLIST, ()),
+        (TECH_ALIAS_TO_CANON, ()),
+    ):
+        for k, v in table.items():
+            if v and k not in skip:
+                lookup[k] = v
+    return lookup
 
 
 def extract_skills_from_text(text: str) -> list[str]:
-    lines = [norm(l) for l in (text or "").splitlines() if norm(l)]
+    lines = [n for n in map(norm, (text or "").splitlines()) if n]
     i = 0
     while i < len(lines):
         m = SKILLS_HEAD.match(lines[i])
@@ -1049,65 +1277,16 @@ def extract_skills_from_text(text: str) -> list[str]:
                 s = lines[j]
                 if NEXT_SECTION_HEAD.match(s):
                     break
-                if len(s) > 140 and re.search(
-                    r"\b(built|designed|developed|managed|implemented|created)\b",
-                    s,
-                    re.I,
-                ):
+                if len(s) > 140 and _BLOCK_END_VERB_RE.search(s):
                     break
                 buf.append(s)
                 j += 1
-            return extract_skills(buf)
+            # buf holds normalized lines already; skip extract_skills' norm pass
+            return _extract_skills(buf)
         i += 1
     return []
 
 
-def _load_compiled_tech_allowlists():
-    """
-    Loads compiled/tech_allowlist.txt and compiled/tech_aliases.json
-    Returns: (enabled: bool, canon_by_key: dict[str,str], alias_to_canon: dict[str,str])
-    """
-    cached = getattr(_load_compiled_tech_allowlists, "_cache", None)
-    if cached is not None:
-        return cached
-
-    try:
-        from pathlib import Path
-        import json
-
-        root = Path(__file__).resolve().parent.parent  # repo root
-        compiled = root / "compiled"
-
-        allow_path = compiled / "tech_allowlist.txt"
-        alias_path = compiled / "tech_aliases.json"
-
-        canon_by_key: dict[str, str] = {}
-        alias_to_canon: dict[str, str] = {}
-
-        if allow_path.exists():
-            for line in allow_path.read_text(encoding="utf-8").splitlines():
-                v = (line or "").strip()
-                if not v:
-                    continue
-                canon_by_key[_norm_key(v)] = v
-
-        if alias_path.exists():
-            data = json.loads(alias_path.read_text(encoding="utf-8"))
-            if isinstance(data, dict):
-                for a, c in data.items():
-                    if not a or not c:
-                        continue
-                    alias_to_canon[_norm_key(str(a))] = str(c).strip()
-
-        enabled = len(canon_by_key) >= 200  # “big enough” safety threshold
-        cached = (enabled, canon_by_key, alias_to_canon)
-    except Exception:
-        cached = (False, {}, {})
-
-    setattr(_load_compiled_tech_allowlists, "_cache", cached)
-    return cached
-
-
 # --- Projects extraction ------------------------------------------------------
 
 import re
@@ -1115,7 +1294,7 @@ import json
 from pathlib import Path
 from typing import Any
 
-_URL_RE = re.compile(r"https?://\S+", re.IGNORECASE)
+_URL_RE = re.compile(r"https?://\S+")
 _MD_LINK_RE = re.compile(r"\[[^\]]+\]\((https?://[^)]+)\)", re.IGNORECASE)
 _BULLET_RE = re.compile(r"^\s*[-•*]\s+")
 _ROLE_RE = re.compile(r"^(role|position)\s*[:\-]\s*(.+)$", re.IGNORECASE)
@@ -1123,47 +1302,9 @@ _TECH_RE = re.compile(
     r"^(tech|stack|tools|technologies)\s*[:\-]\s*(.+)$", re.IGNORECASE
 )
 
-# headings to ignore if they appear in the passed lines
-_IGNORE_HEADINGS = {
-    "projects",
-    "selected projects",
-    "personal projects",
-    "academic projects",
-    "side projects",
-    "key projects",
-    "experience",
-    "work experience",
-    "professional experience",
-    "employment",
-    "skills",
-    "education",
-    "certifications",
-    "certs",
-    "languages",
-    "summary",
-}
-
-# job titles that must NOT be treated as projects
-_JOB_TITLES = [
-    "project manager",
-    "project lead",
-    "project coordinator",
-    "project director",
-    "program manager",
-    "product manager",
-    "scrum master",
-]
-
-# Optional allowlist module (if you have it). Safe fallback if not present.
-try:
-    from .allowlists import TECH_ALLOWLIST, TECH_ALIASES  # type: ignore
-except Exception:  # pragma: no cover
-    TECH_ALLOWLIST = None
-    TECH_ALIASES = {}
-
-
 def _norm_space(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip())
+    # same contract as norm() (collapse \s+ runs, strip); one implementation
+    return norm(s)
 
 
 def _is_bullet(s: str) -> bool:
@@ -1175,7 +1316,8 @@ def _strip_bullet(s: str) -> str:
 
 
 def _split_tokens(s: str) -> list[str]:
-    raw = re.split(r"[;,|]\s*|\s*/\s*", s or "")
+    # fold ; | / into "," and split once; whitespace around them is normalized below
+    raw = (s or "").replace(";", ",").replace("|", ",").replace("/", ",").split(",")
     out: list[str] = []
     for t in raw:
         t = _norm_space(t)
@@ -1194,122 +1336,6 @@ def _collect_links(line: str) -> list[str]:
     return cleaned
 
 
-def _is_heading_line(line: str) -> bool:
-    s = _norm_space(line).casefold()
-    return s in _IGNORE_HEADINGS
-
-
-def _looks_like_experience_title(line: str) -> bool:
-    """
-    Treat as EXPERIENCE (not PROJECTS) if line begins with a known job title and
-    appears to mention a company via separator:
-      - "Project Manager at ABC Corp"
-      - "Project Manager — ABC Corp"
-      - "Project Manager - ABC Corp"
-    """
-    s = _strip_bullet(_norm_space(line)).casefold()
-    if not s:
-        return False
-
-    for jt in _JOB_TITLES:
-        if s.startswith(jt):
-            # company signal separators
-            if " at " in s:
-                return True
-            if " — " in s or " – " in s or " - " in s:
-                return True
-    return False
-
-
-def _canonical_tech(token: str) -> str | None:
-    t = _norm_space(token)
-    if not t:
-        return None
-
-    key = t.casefold()
-    if isinstance(TECH_ALIASES, dict) and key in TECH_ALIASES:
-        t = TECH_ALIASES[key]
-
-    if TECH_ALLOWLIST is not None:
-        allow = {x.casefold() for x in TECH_ALLOWLIST}
-        if t.casefold() not in allow:
-            return None
-
-    return t
-
-
-def _parse_dates_line(line: str) -> dict[str, str | None] | None:
-    """
-    Uses your existing parse_date_range() from rules.py.
-    """
-    try:
-        ds = parse_date_range(line)  # noqa: F821 (already exists in this module)
-    except Exception:
-        return None
-
-    if not ds:
-        return None
-
-    if isinstance(ds, dict):
-        return {"start": ds.get("start"), "end": ds.get("end")}
-
-    start = getattr(ds, "start", None)
-    end = getattr(ds, "end", None)
-    if start is None and end is None:
-        return None
-    return {"start": start, "end": end}
-
-
-def _parse_title_role_dates(
-    title_line: str,
-) -> tuple[str, str | None, dict[str, str | None]]:
-    """
-    Title line examples:
-      - "StockAI — Personal Project (2024-01 to Present)"
-      - "My App - Backend Developer | https://..."
-      - "Portfolio Website (2023)"
-    We want:
-      title, role (optional), dates {start,end}
-    """
-    line = _strip_bullet(_norm_space(title_line))
-
-    # pull out parenthetical chunk(s) for date parsing
-    dates = {"start": None, "end": None}
-    m = re.search(r"\(([^)]+)\)", line)
-    if m:
-        d = _parse_dates_line(m.group(1))
-        if d:
-            dates = d
-        # remove that parenthetical from role text
-        line_wo_paren = (line[: m.start()] + line[m.end() :]).strip()
-    else:
-        line_wo_paren = line
-
-    # split on dash variants to infer role
-    role = None
-    title = line_wo_paren
-
-    for sep in ["—", "–", "-"]:
-        if sep in line_wo_paren:
-            left, right = line_wo_paren.split(sep, 1)
-            left = _norm_space(left)
-            right = _norm_space(right)
-            if left:
-                title = left
-            if right:
-                # if right is clearly a role phrase, store it
-                role = right
-            break
-
-    title = _norm_space(title)
-    if role is not None:
-        role = _norm_space(role)
-        if not role:
-            role = None
-
-    return title, role, dates
-
-
 # -------------------- PROJECTS extraction --------------------
 
 PROJECTS_HEAD = re.compile(
@@ -1322,14 +1348,23 @@ LINK_LINE_RE = re.compile(
     re.I,
 )
 
-# Reuse your existing TECH_LINE_RE if you already have it.
-# If you DON'T have TECH_LINE_RE in rules.py, keep this definition.
-try:
-    TECH_LINE_RE
-except NameError:
-    TECH_LINE_RE = re.compile(r"^(tech|stack|tools|technologies?)\s*:\s*(.+)$", re.I)
 
-_URL_RE = re.compile(r"https?://\S+")
+# extract_projects' line classes in one match: TECH_LINE_RE | LINK_LINE_RE | _BULLET_RE.
+# They can't overlap (t/s, l/r/g and bullet chars start them), so m.lastgroup names
+# the one that matched.
+_PROJECT_LINE_RE = _hot_re(
+    r"^(?:\s*(?:tech|tools|stack)\s*:\s*(?P<tech>.+)\s*$"
+    r"|(?:links?|link|repo|repository|github)\s*:\s*(?P<link>.+)$"
+    r"|(?P<bullet>\s*[-•*]\s+))",
+    re.I,
+)
+
+
+_BULLET_STRIP_RE = re.compile(r"^[\-\*\u2022]\s+")
+_TRAILING_PAREN_RE = re.compile(r"\(([^)]*)\)\s*$")
+_PAREN_DATE_HINT_RE = re.compile(r"\d{4}|\bpresent\b|\bcurrent\b", re.I)
+# title/role separator in project headings: —, – or a spaced hyphen
+_DASH_SEP_RE = re.compile(r"\s+[—–-]\s+")
 
 
 def _parse_project_heading(line: str) -> tuple[str, str, dict]:
@@ -1340,10 +1375,11 @@ def _parse_project_heading(line: str) -> tuple[str, str, dict]:
       "StockAI — Personal Project (2024-01 to Present)"
       "My App - Capstone Project (2023)"
       "Tooling Dashboard — (2022-05 to 2022-09)"
+
+    Expects a norm()'d line (extract_projects normalizes up front).
     """
-    s = norm(line)
     # remove leading bullets if present
-    s = re.sub(r"^[\-\*\u2022]\s+", "", s).strip()
+    s = _BULLET_STRIP_RE.sub("", line).strip()
 
     # dates: let your existing parse_date_range do the hard work
     start, end, _months = parse_date_range(s)
@@ -1352,20 +1388,42 @@ def _parse_project_heading(line: str) -> tuple[str, str, dict]:
     # remove a trailing (...) chunk if it likely contains dates
     # (prevents role/title pollution)
     s2 = s
-    m = re.search(r"\(([^)]*)\)\s*$", s2)
+    m = _TRAILING_PAREN_RE.search(s2)
     if m:
         tail = m.group(1)
-        if re.search(r"\d{4}|\bpresent\b|\bcurrent\b", tail, re.I):
+        if _PAREN_DATE_HINT_RE.search(tail):
             s2 = s2[: m.start()].strip()
 
     # split title vs role on a dash separator (—, –, or " - ")
-    parts = re.split(r"\s+[—–-]\s+", s2, maxsplit=1)
+    parts = _DASH_SEP_RE.split(s2, maxsplit=1)
     title = parts[0].strip()
     role = parts[1].strip() if len(parts) == 2 else ""
 
     return title, role, dates
 
 
+@dataclass(slots=True)
+class _ProjectItem:
+    """Working state for one project while scanning; serialized once at the end."""
+
+    title: str
+    role: str = ""
+    tech_stack: list[str] = field(default_factory=list)
+    links: list[str] = field(default_factory=list)
+    dates: dict = field(default_factory=dict)
+    bullets: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "title": self.title,
+            "role": self.role,
+            "tech_stack": self.tech_stack,
+            "links": self.links,
+            "dates": self.dates,
+            "bullets": self.bullets,
+        }
+
+
 def extract_projects(lines: list[str]) -> list[dict]:
     """
     Contract:
@@ -1377,17 +1435,20 @@ def extract_projects(lines: list[str]) -> list[dict]:
         - dates ({start,end})
         - bullets (list[str])
     """
-    raw = [norm(x) for x in (lines or []) if norm(x)]
-    if not raw:
+    normed = (n for n in map(norm, lines or []) if n)
+    first = next(normed, None)
+    if first is None:
         return []
 
     # Disambiguation: only parse when the *block itself* is a Projects section.
     # This prevents EXPERIENCE lines like "Project Manager — ..." from being misread.
-    if not PROJECTS_HEAD.match(raw[0]):
+    # Checked on the first line alone, before normalizing the rest of the block.
+    if not PROJECTS_HEAD.match(first):
         return []
+    raw = [first, *normed]
 
-    projects: list[dict] = []
-    cur: dict | None = None
+    projects: list[_ProjectItem] = []
+    cur: _ProjectItem | None = None
 
     def _start_new_project(heading_line: str):
         nonlocal cur
@@ -1397,31 +1458,21 @@ def extract_projects(lines: list[str]) -> list[dict]:
         if not title:
             return
 
-        cur = {
-            "title": title,
-            "role": role or "",  # keep string (not None)
-            "tech_stack": [],
-            "links": [],
-            "dates": dates,
-            "bullets": [],
-        }
+        # keep role a string (not None)
+        cur = _ProjectItem(title=title, role=role or "", dates=dates)
         projects.append(cur)
 
     # Iterate after the heading line
     for line in raw[1:]:
-        if not line:
-            continue
+        # classify once: "tech" / "link" / "bullet" / None (plain line)
+        m = _PROJECT_LINE_RE.match(line)
+        kind = m.lastgroup if m else None
 
         # New project heading heuristic:
         # - Not a Tech/Link line
         # - Not a pure bullet line
         # - Often contains a dash separator or parentheses with dates
-        if (
-            not TECH_LINE_RE.match(line)
-            and not LINK_LINE_RE.match(line)
-            and not re.match(r"^[\-\*\u2022]\s+", line)
-            and (re.search(r"\s+[—–-]\s+", line) or DATE_RE.search(line))
-        ):
+        if kind is None and (_DASH_SEP_RE.search(line) or DATE_RE.search(line)):
             _start_new_project(line)
             continue
 
@@ -1430,59 +1481,66 @@ def extract_projects(lines: list[str]) -> list[dict]:
             continue
 
         # Tech line -> tokenize -> allowlist filter
-        mtech = TECH_LINE_RE.match(line)
-        if mtech:
-            tech_raw = mtech.group(2).strip()
+        if kind == "tech":
+            tech_raw = m.group("tech").strip()
             tokens = _split_on_separators(tech_raw)
             tech = _filter_tech_allowlist(
                 tokens
             )  # drops unknown tokens in allowlist mode
             for t in tech:
-                if t not in cur["tech_stack"]:
-                    cur["tech_stack"].append(t)
+                if t not in cur.tech_stack:
+                    cur.tech_stack.append(t)
             continue
 
         # Link line (or any URLs)
-        mlink = LINK_LINE_RE.match(line)
-        if mlink:
-            urls = _URL_RE.findall(mlink.group(1))
+        if kind == "link":
+            urls = _URL_RE.findall(m.group("link"))
         else:
             urls = _URL_RE.findall(line)
 
         if urls:
             for u in urls:
-                if u not in cur["links"]:
-                    cur["links"].append(u)
+                if u not in cur.links:
+                    cur.links.append(u)
             continue
 
-        # Bullet / description line
-        b = re.sub(r"^[\-\*\u2022]\s+", "", line).strip()
+        # Bullet / description line (slice off the prefix we already matched)
+        b = line[m.end() :].strip() if kind == "bullet" else line
         if b:
-            cur["bullets"].append(b)
+            cur.bullets.append(b)
 
     # Drop empty shells (no title already filtered; this is extra safety)
-    projects = [p for p in projects if p.get("title")]
+    return [p.to_dict() for p in projects if p.title]
 
-    return projects
+
+_TRAILING_DOTS_RE = re.compile(r"[.\s]+$")
 
 
 def _split_simple_tokens(s: str) -> list[str]:
     # Split common “tech stack” separators: commas, pipes, slashes, bullets
-    parts = re.split(r"[,\|/;•·]+", s or "")
+    # (folded to "," with C-level replaces, then one split)
+    parts = (
+        (s or "")
+        .replace("|", ",")
+        .replace("/", ",")
+        .replace(";", ",")
+        .replace("•", ",")
+        .replace("·", ",")
+        .split(",")
+    )
     out = []
     for p in parts:
-        p = (p or "").strip()
+        p = p.strip()
         if not p:
             continue
-        # remove trailing punctuation
-        p = re.sub(r"[.\s]+$", "", p).strip()
+        # remove trailing punctuation (p is stripped, so only a trailing "." can match)
+        if p[-1] == ".":
+            p = _TRAILING_DOTS_RE.sub("", p).strip()
         if p:
             out.append(p)
     return out
 
 
-_TECH_ALLOW_CACHE = None
-_SKILLS_ALLOW_CACHE = None
 
 
 def _find_compiled_dir() -> Path | None:
@@ -1501,35 +1559,38 @@ def _find_compiled_dir() -> Path | None:
     return None
 
 
-def _read_allowlist_values(path: Path) -> list[str]:
+def _read_allowlist_values(path: Path):
     """
-    Allow either:
-    - .txt (one per line)
+    Yield allowlist values (stripped, non-empty) from either:
+    - .txt (one per line, streamed)
     - .json (either list[str] or dict[str, ...] where keys are canonical labels)
     """
     if not path.exists():
-        return []
+        return
 
     if path.suffix.lower() == ".txt":
-        return [
-            ln.strip()
-            for ln in path.read_text(encoding="utf-8").splitlines()
-            if ln.strip()
-        ]
+        with path.open(encoding="utf-8") as f:
+            for ln in f:
+                ln = ln.strip()
+                if ln:
+                    yield ln
+        return
 
     if path.suffix.lower() == ".json":
-        obj = json.loads(path.read_text(encoding="utf-8"))
-        if isinstance(obj, list):
-            return [str(x).strip() for x in obj if str(x).strip()]
-        if isinstance(obj, dict):
-            return [str(k).strip() for k in obj.keys() if str(k).strip()]
-
-    return []
+        obj = _load_json(path)
+        if isinstance(obj, (list, dict)):
+            # a dict's keys are the canonical labels
+            for x in obj:
+                x = str(x).strip()
+                if x:
+                    yield x
 
 
+@lru_cache(maxsize=None)
 def _load_allowlist_pair(base_name: str, aliases_name: str):
     """
     Robustly find allowlist in either .txt or .json if caller passes a .txt name.
+    Loaded once per (base, aliases) pair; callers must not mutate the dicts.
     """
     compiled_dir = _find_compiled_dir()
     if not compiled_dir:
@@ -1544,20 +1605,26 @@ def _load_allowlist_pair(base_name: str, aliases_name: str):
 
     aliases_path = compiled_dir / aliases_name
 
-    values = _read_allowlist_values(base_path)
-    if not values:
+    # built straight from the stream; no intermediate list of values
+    canon_by_key = {
+        intern(_norm_key(v)): intern(v) for v in _read_allowlist_values(base_path)
+    }
+    if not canon_by_key:
         return False, {}, {}
 
-    canon_by_key = {_norm_key(v): v for v in values}
-
     alias_to_canon = {}
     if aliases_path.exists():
-        data = json.loads(aliases_path.read_text(encoding="utf-8"))
+        data = _load_json(aliases_path)
         if isinstance(data, dict):
             for a, c in data.items():
                 if not a or not c:
                     continue
-                alias_to_canon[_norm_key(a)] = str(c).strip()
+                key = _norm_key(a)
+                # an exact allowlist entry beats a Linguist alias of another
+                # language ("django" is Django, not the Jinja template syntax)
+                if key in canon_by_key:
+                    continue
+                alias_to_canon[intern(key)] = intern(str(c).strip())
 
     enabled = len(canon_by_key) >= 200
     return enabled, canon_by_key, alias_to_canon
@@ -1571,9 +1638,73 @@ def _load_compiled_skills_allowlists():
     return _load_allowlist_pair("skills_allowlist.json", "skills_aliases.json")
 
 
+@lru_cache(maxsize=None)
+def _tech_lookup() -> tuple[bool, dict[str, str]]:
+    """
+    Tech alias + canon tables merged into one key -> canon dict, so a token
+    costs a single .get(). Aliases win, matching the alias-then-canon order.
+    """
+    enabled, canon_by_key, alias_to_canon = _load_compiled_tech_allowlists()
+    return enabled, {**canon_by_key, **alias_to_canon}
+
+
+@lru_cache(maxsize=None)
+def _tech_automaton():
+    """
+    Aho-Corasick automaton over every tech key (USE_AHOCORASICK=1 + pyahocorasick).
+    Values are (key length, canon). None when disabled/unavailable.
+    """
+    if not (USE_AHOCORASICK and ahocorasick is not None):
+        return None
+    enabled, lookup = _tech_lookup()
+    if not enabled:
+        return None
+    ac = ahocorasick.Automaton()
+    for key, canon in lookup.items():
+        if key:
+            ac.add_word(key, (len(key), canon))
+    ac.make_automaton()
+    return ac
+
+
+# hits must be delimited by these (so "R&D" / "react.js" don't yield "r" / "react")
+_AC_EDGE = frozenset(" ,;/|•·●◦()[]:")
+
+
+def _scan_tech_ac(ac, tail: str) -> list[str]:
+    """
+    One pass over the normalized tail: delimited hits only, leftmost-longest,
+    non-overlapping, de-duped in order. Catches multi-word entries
+    ("amazon web services") that separator splitting misses.
+    """
+    hay = _norm_key(tail).rstrip(".") + " "
+    hits = []
+    for end, (klen, canon) in ac.iter(hay):
+        start = end - klen + 1
+        if start and hay[start - 1] not in _AC_EDGE:
+            continue
+        if hay[end + 1] not in _AC_EDGE:
+            continue
+        hits.append((start, -klen, canon))
+    hits.sort()
+    out = []
+    pos = 0
+    for start, neg_len, canon in hits:
+        if start >= pos:
+            out.append(canon)
+            pos = start - neg_len
+    return list(dict.fromkeys(out))
+
+
 TECH_ALLOWLIST_ENABLED, TECH_ALLOWLIST, TECH_ALIAS_TO_CANON = (
     _load_compiled_tech_allowlists()
 )
+SKILLS_ALLOWLIST_ENABLED, SKILLS_ALLOWLIST, SKILLS_ALIAS_TO_CANON = (
+    _load_compiled_skills_allowlists()
+)
+_ANY_ALLOWLIST_ENABLED = bool(TECH_ALLOWLIST_ENABLED or SKILLS_ALLOWLIST_ENABLED)
+# reverse set for "is this a skills canon?" (dict.values() membership is a linear scan)
+_SKILLS_CANON_VALUES = frozenset(SKILLS_ALLOWLIST.values())
 
 
 def _pretty_label(
@@ -1604,14 +1735,12 @@ def _filter_tech_allowlist(tokens: list[str]) -> list[str]:
     - skills allowlist (secondary fallback)
     If allowlists are not available, returns a conservative de-duped list.
     """
-    tech_enabled, tech_canon_by_key, tech_alias_to_canon = (
-        _load_compiled_tech_allowlists()
-    )
-    skills_enabled, skills_canon_by_key, skills_alias_to_canon = (
-        _load_compiled_skills_allowlists()
-    )
-
-    allow_enabled = bool(tech_enabled or skills_enabled)
+    # allowlists are bound once at import (above), not reloaded per call
+    tech_enabled, skills_enabled = TECH_ALLOWLIST_ENABLED, SKILLS_ALLOWLIST_ENABLED
+    tech_canon_by_key, tech_alias_to_canon = TECH_ALLOWLIST, TECH_ALIAS_TO_CANON
+    skills_canon_by_key = SKILLS_ALLOWLIST
+    skills_alias_to_canon = SKILLS_ALIAS_TO_CANON
+    allow_enabled = _ANY_ALLOWLIST_ENABLED
 
     out: list[str] = []
     seen: set[str] = set()
@@ -1643,7 +1772,7 @@ def _filter_tech_allowlist(tokens: list[str]) -> list[str]:
             continue
 
         label = canon
-        if skills_enabled and canon in skills_canon_by_key.values():
+        if skills_enabled and canon in _SKILLS_CANON_VALUES:
             label = _pretty_label(canon, skills_canon_by_key, skills_alias_to_canon)
 
         lk = label.casefold()
@@ -2,47 +2,76 @@
 from __future__ import annotations
 
 import re
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Tuple, Any
 
-# Canonical (UPPERCASE) buckets used by the parser code
-SECTION_PATTERNS: Tuple[Tuple[str, re.Pattern], ...] = (
+from .rules import _hot_re
+
+# Canonical (UPPERCASE) buckets used by the parser code, in priority order:
+# heading alternations (without the ^ anchor / trailing \b). Within a bucket the
+# most common heading comes first and aliases sharing a word are factored, so the
+# engine tries fewer branches per line.
+_SECTION_HEADINGS: Tuple[Tuple[str, str], ...] = (
     (
         "SUMMARY",
-        re.compile(
-            r"(?i)^(summary|profile|professional\s+summary|about\s+me|objective)\b"
-        ),
+        r"summary|profile|objective|professional\s+summary|about\s+me",
     ),
     (
         "SKILLS",
-        re.compile(r"(?i)^(skills|technical\s+skills|core\s+skills|key\s+skills)\b"),
+        r"skills|(?:technical|core|key)\s+skills",
     ),
     (
         "EXPERIENCE",
         # IMPORTANT: do NOT include "projects" here
-        re.compile(
-            r"(?i)^(work\s+experience|professional\s+experience|experience|employment|employment\s+history|career\s+history|industry\s+experience|relevant\s+experience)\b"
-        ),
+        r"experience|(?:work|professional|relevant|industry)\s+experience"
+        r"|employment(?:\s+history)?|career\s+history",
     ),
     (
         "PROJECTS",
-        re.compile(
-            r"(?i)^(projects|selected\s+projects|personal\s+projects|academic\s+projects|side\s+projects|key\s+projects)\b"
-        ),
+        r"projects|(?:personal|academic|selected|side|key)\s+projects",
     ),
     (
         "EDUCATION",
-        re.compile(r"(?i)^(education|academic\s+background|academics)\b"),
+        r"education|academic(?:s|\s+background)",
     ),
     (
         "CERTS",
-        re.compile(r"(?i)^(certifications|certificates|certs|licenses)\b"),
+        r"certifications|certificates|certs|licenses",
     ),
     (
         "LANGUAGES",
-        re.compile(r"(?i)^(languages|language)\b"),
+        r"languages?",
     ),
 )
 
+SECTION_PATTERNS: Tuple[Tuple[str, re.Pattern], ...] = tuple(
+    (key, re.compile(rf"(?i)^({alts})\b")) for key, alts in _SECTION_HEADINGS
+)
+
+# All headings in one alternation: one named group per bucket (m.lastgroup is the
+# key), and the line must end right after the heading or continue with a
+# delimiter (: - – —). m.end() is where the inline tail starts,
+# e.g. 'Skills: Python, SQL' -> 'Python, SQL'.
+# Compiled with rules' RE2 / PCRE2-JIT switch (USE_RE2 / USE_PCRE2) since it runs
+# on every candidate line.
+_HEADING_RE = _hot_re(
+    r"^(?:"
+    + "|".join(f"(?P<{key}>{alts})" for key, alts in _SECTION_HEADINGS)
+    + r")\b(?:\s*[:\-–—]\s*|$)",
+    re.I,
+)
+
+# first letters of every heading alias: most body lines (bullets, dates, names)
+# can be rejected on line[0] alone without running _HEADING_RE
+_HEADING_STARTS = frozenset(
+    ch
+    for _, alts in _SECTION_HEADINGS
+    # letters opening an alternative (a superset is harmless: it only gates the regex)
+    for ch in re.findall(r"(?:^|\||\(\?:)(\w)", alts)
+)
+
+# bucket keys in output order; "OTHER" collects text before the first heading
+_BUCKET_KEYS: Tuple[str, ...] = tuple(k for k, _ in _SECTION_HEADINGS) + ("OTHER",)
+
 # Lowercase aliases required by tests / external callers
 LOWER_MAP: Dict[str, str] = {
     "SUMMARY": "summary",
@@ -56,28 +85,6 @@ LOWER_MAP: Dict[str, str] = {
 }
 
 
-def _match_heading(line: str, pat: re.Pattern) -> Optional[str]:
-    """
-    A line is a heading only if:
-      - it matches at the beginning, AND
-      - the rest of the line is empty OR starts with a delimiter (: - – —).
-    Returns "tail text" after delimiter (e.g., 'Skills: Python, SQL' -> 'Python, SQL'),
-    or "" if no tail, or None if not a heading.
-    """
-    m = pat.match(line)
-    if not m:
-        return None
-
-    rest = line[m.end() :]
-    if rest:
-        # must be delimiter-only after heading
-        if not re.match(r"^\s*[:\-–—]\s*", rest):
-            return None
-        rest = re.sub(r"^\s*[:\-–—]\s*", "", rest)
-
-    return rest.strip()
-
-
 def split_sections(text: str) -> Dict[str, Any]:
     """
     Splits resume text into sections by headings.
@@ -86,37 +93,31 @@ def split_sections(text: str) -> Dict[str, Any]:
       - UPPERCASE keys -> list[str] (legacy / parser-friendly)
       - lowercase keys -> str (test-friendly: supports .strip())
     """
-    buckets: Dict[str, List[str]] = {k: [] for k, _ in SECTION_PATTERNS}
-    buckets["OTHER"] = []
+    buckets: Dict[str, Any] = {k: [] for k in _BUCKET_KEYS}
 
-    current = "OTHER"
+    # the list lines currently go to; rebound only when a heading switches bucket
+    current = buckets["OTHER"]
 
+    # Line by line on purpose: one MULTILINE finditer over the whole text measured
+    # slower (~1.5x), since the scan still visits every position and the bodies
+    # between headings still have to be split and stripped per line.
     for raw in text.splitlines():
         line = raw.strip()
         if not line:
             continue
 
-        switched = False
-        for key, pat in SECTION_PATTERNS:
-            tail = _match_heading(line, pat)
-            if tail is None:
-                continue
-
-            current = key
-            switched = True
+        m = _HEADING_RE.match(line) if line[0].casefold() in _HEADING_STARTS else None
+        if m:
+            current = buckets[m.lastgroup]
+            # lstrip: RE2's \s is ASCII-only, so it may leave e.g. a NBSP behind
+            tail = line[m.end() :].lstrip()
             if tail:
-                buckets[current].append(tail)
-            break
-
-        if switched:
+                current.append(tail)
             continue
 
-        buckets[current].append(line)
-
-    out: Dict[str, Any] = dict(buckets)
-
-    # Add lowercase string views (what your tests expect)
-    for upper, lower in LOWER_MAP.items():
-        out[lower] = "\n".join(buckets.get(upper, [])).strip()
+        current.append(line)
 
-    return out
+    # Add lowercase string views (what your tests expect); lines are already
+    # stripped and non-empty, so the join needs no strip
+    buckets.update((LOWER_MAP[k], "\n".join(buckets[k])) for k in _BUCKET_KEYS)
+    return buckets
@@ -10,14 +10,25 @@ from flask import (
     session,
     flash,
     send_from_directory,
+    g,
+    Response,
 )
-import sqlite3, os, json, uuid
+import sqlite3, os, json, uuid, queue
 from resume_parser import parse_resume
-from werkzeug.utils import secure_filename
+from werkzeug.utils import safe_join
+from flask.sessions import SessionInterface
 from datetime import timedelta, datetime, timezone
 from werkzeug.security import generate_password_hash, check_password_hash
 import secrets
-from functools import wraps
+import hashlib
+import time
+from urllib.parse import quote
+from functools import lru_cache, partial, wraps
+from contextlib import contextmanager
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import threading
 
 
 # Optional pure-Python MIME sniff (no system deps). If missing, we just skip.
@@ -25,6 +36,18 @@ try:
     import filetype  # pip install filetype
 except Exception:
     filetype = None
+# Optional faster JSON encoder for the JSON TEXT columns (pip install orjson).
+try:
+    import orjson
+except Exception:
+    orjson = None
+# Optional Argon2id password hashing (pip install argon2-cffi). Without it, new
+# hashes use Werkzeug's PASSWORD_HASH_METHOD; either kind verifies.
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHashError, VerificationError
+except Exception:
+    PasswordHasher = None
 SCHEMA_SQL = """
 PRAGMA foreign_keys = ON;
 
@@ -54,52 +77,503 @@ CREATE TABLE IF NOT EXISTS candidates (
     raw_text    TEXT,
     filepath    TEXT,                              -- NEW: saved file path
     created_at  TEXT NOT NULL,                     -- NEW: audit/sorting
+    status      TEXT NOT NULL DEFAULT 'ready',     -- parsing | ready | failed
+    original_filename TEXT,                        -- name as uploaded (files are stored hashed)
     FOREIGN KEY(user_id) REFERENCES users(id) ON DELETE CASCADE
 );
 
+-- per-user CV counts for /admin/users, kept current by the triggers below
+-- instead of a GROUP BY over every candidate on each page load
+CREATE TABLE IF NOT EXISTS user_upload_counts (
+    user_id INTEGER PRIMARY KEY,
+    n       INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_candidates_count_ins AFTER INSERT ON candidates
+BEGIN
+    INSERT INTO user_upload_counts (user_id, n) VALUES (NEW.user_id, 1)
+    ON CONFLICT(user_id) DO UPDATE SET n = n + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_candidates_count_del AFTER DELETE ON candidates
+BEGIN
+    UPDATE user_upload_counts SET n = n - 1 WHERE user_id = OLD.user_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_users_count_del AFTER DELETE ON users
+BEGIN
+    DELETE FROM user_upload_counts WHERE user_id = OLD.id;
+END;
+
+-- index(): WHERE user_id=? ORDER BY id DESC. SQLite indexes carry the rowid (= id),
+-- so this serves both the filter and the ordering without a sort.
+CREATE INDEX IF NOT EXISTS idx_candidates_user ON candidates(user_id);
+
 -- Optional: if you already support password resets
 CREATE TABLE IF NOT EXISTS reset_tokens (
     id         INTEGER PRIMARY KEY AUTOINCREMENT,
     user_id    INTEGER NOT NULL,
-    token      TEXT NOT NULL UNIQUE,
+    token      TEXT NOT NULL UNIQUE,               -- blake2b digest of the token
     expires_at TEXT NOT NULL,
     used       INTEGER NOT NULL DEFAULT 0,
     FOREIGN KEY(user_id) REFERENCES users(id) ON DELETE CASCADE
 );
+
+-- reset_tokens: user_id serves the ON DELETE CASCADE from users (no scan per
+-- deleted account); expires_at serves the purge of expired tokens
+CREATE INDEX IF NOT EXISTS idx_reset_tokens_user ON reset_tokens(user_id);
+CREATE INDEX IF NOT EXISTS idx_reset_tokens_expires ON reset_tokens(expires_at);
 """
 app = Flask(__name__)
 app.config.update(
     SESSION_COOKIE_HTTPONLY=True,
     SESSION_COOKIE_SAMESITE="Lax",
     SESSION_COOKIE_SECURE=bool(os.environ.get("COOKIE_SECURE", "0") == "1"),
+    # only send Set-Cookie when the session changed (last_seen is refreshed at
+    # most once a minute, which also renews the permanent cookie's expiry)
+    SESSION_REFRESH_EACH_REQUEST=False,
 )
 app.secret_key = os.environ.get("SECRET_KEY", "dev-secret-change-me")
 app.permanent_session_lifetime = timedelta(minutes=30)
+
+# Optional server-side sessions (pip install flask-session redis). With REDIS_URL
+# set, session data lives in Redis and the cookie only carries the session id, so
+# the per-request last_seen write no longer re-signs and resends the whole cookie.
+REDIS_URL = os.environ.get("REDIS_URL", "")
+if REDIS_URL:
+    try:
+        import redis
+        from flask_session import Session
+    except Exception as e:
+        Session = None
+        app.logger.warning(
+            "REDIS_URL is set but flask-session/redis could not be imported (%s); "
+            "falling back to signed-cookie sessions",
+            e,
+        )
+    if Session is not None:
+        app.config.update(
+            SESSION_TYPE="redis",
+            SESSION_REDIS=redis.Redis.from_url(REDIS_URL),
+        )
+        Session(app)
+
+
+class _HealthzSessionInterface(SessionInterface):
+    """Wraps the app's session interface so /healthz probes never load or save
+    a session (no cookie decode/verify, no Redis round trip)."""
+
+    def __init__(self, inner: SessionInterface):
+        self.inner = inner
+
+    def open_session(self, app, request):
+        if request.path == "/healthz":
+            return self.make_null_session(app)
+        return self.inner.open_session(app, request)
+
+    def save_session(self, app, session, response):
+        if self.is_null_session(session):
+            return
+        return self.inner.save_session(app, session, response)
+
+
+app.session_interface = _HealthzSessionInterface(app.session_interface)
 IDLE_TIMEOUT_MIN = 15
+LAST_SEEN_REFRESH_S = 60  # coarse last_seen updates: the cookie is only re-signed about once a minute
 BASE_DIR = os.path.dirname(os.path.abspath(__file__)) 
 DB_PATH  = os.environ.get("DB_PATH", os.path.join(BASE_DIR, "database.db"))
 UPLOAD_DIR = os.environ.get("UPLOAD_DIR", os.path.join(BASE_DIR, "uploads"))
-ALLOWED_EXTS = {"pdf", "docx"}
-os.makedirs(UPLOAD_DIR, exist_ok=True)
+ALLOWED_EXTS = frozenset({"pdf", "docx"})
+os.makedirs(UPLOAD_DIR, exist_ok=True)  # once at import; handlers assume it exists
 app.config["MAX_CONTENT_LENGTH"] = 10 * 1024 * 1024  # 10 MB
+# outside DEV, templates are compiled once and served from Jinja's cache
+# (no per-request mtime checks)
+app.config["TEMPLATES_AUTO_RELOAD"] = os.environ.get("DEV", "0") == "1"
+PAGE_SIZE = 50  # candidates per page on index()
+# a background parse takes seconds; a row still 'parsing' after this long lost
+# its worker (crash/restart) and is shown, then stored, as failed
+PARSE_STALE_S = 600
+# INSERT ... RETURNING needs SQLite 3.35+ (the library Python links, not the module)
+_SQLITE_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+# Werkzeug KDF profile when argon2-cffi is missing (scrypt N=2^15, r=8, p=1:
+# ~0.15 s, vs ~0.5 s for pbkdf2:sha256 at 1M rounds); existing hashes keep
+# verifying with their own method
+PASSWORD_HASH_METHOD = os.environ.get("PASSWORD_HASH_METHOD", "scrypt:32768:8:1")
+# failed logins per (username, client address) before /login refuses that
+# username for the rest of the window; keyed on the username too because
+# behind a proxy every client shares one remote_addr
+LOGIN_MAX_FAILURES = 10
+LOGIN_FAILURE_WINDOW_S = 300
+# CV downloads can be handed off to the front server instead of streamed by a
+# worker: X_ACCEL_PREFIX for nginx (e.g. "/_protected_cvs/" mapped to an
+# `internal` location aliasing UPLOAD_DIR), USE_X_SENDFILE=1 for servers that
+# honour X-Sendfile (Apache mod_xsendfile, lighttpd).
+X_ACCEL_PREFIX = os.environ.get("X_ACCEL_PREFIX", "")
+app.use_x_sendfile = os.environ.get("USE_X_SENDFILE", "0") == "1"
+
+
+_ts_cache = (0, "")  # (whole second, its ISO string)
+
+
+def _now_iso() -> str:
+    """UTC now as ISO 8601 at second resolution, formatted once per second."""
+    global _ts_cache
+    t = int(time.time())
+    cached = _ts_cache
+    if cached[0] != t:
+        cached = _ts_cache = (t, datetime.fromtimestamp(t, timezone.utc).isoformat())
+    return cached[1]
+
+
+def _iso_ago(seconds: int) -> str:
+    """_now_iso() minus `seconds`, for comparisons against stored timestamps."""
+    return datetime.fromtimestamp(int(time.time()) - seconds, timezone.utc).isoformat()
+
+
+def _connect() -> sqlite3.Connection:
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)  # pooled across threads
+    # per-connection settings (the schema's foreign_keys pragma only covered
+    # init_db's own connection)
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA synchronous = NORMAL")  # safe with WAL, fewer fsyncs
+    conn.execute("PRAGMA cache_size = -20000")  # ~20 MB page cache
+    conn.execute("PRAGMA temp_store = MEMORY")  # ORDER BY / GROUP BY temp b-trees
+    conn.execute("PRAGMA mmap_size = 134217728")  # read pages via mmap (128 MB)
+    return conn
+
+
+# Idle connections, reused across requests: no open/close, PRAGMA setup or cold
+# page cache per request. Sized to the server's thread count (Procfile: 8).
+_db_pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(
+    maxsize=int(os.environ.get("DB_POOL_SIZE", "8"))
+)
+
+
+def _pool_take() -> sqlite3.Connection:
+    try:
+        return _db_pool.get_nowait()
+    except queue.Empty:
+        return _connect()
+
+
+def _pool_give(conn: sqlite3.Connection) -> None:
+    # never hand a half-done transaction to the next user
+    if conn.in_transaction:
+        conn.rollback()
+    try:
+        _db_pool.put_nowait(conn)
+    except queue.Full:
+        conn.close()
+
+
+@contextmanager
+def get_conn():
+    """
+    A pooled connection for code outside a request (background parse callbacks,
+    scripts): `with get_conn() as conn: ...` returns it to the pool afterwards.
+    Request handlers use get_db(), which keeps one connection for the request.
+    """
+    conn = _pool_take()
+    try:
+        yield conn
+    finally:
+        _pool_give(conn)
+
+
+def get_db() -> sqlite3.Connection:
+    """
+    The request's SQLite connection: taken from the pool on first use, shared by
+    every query in the request (current_user() included), handed back by
+    close_db() at teardown.
+    """
+    if "db" not in g:
+        g.db = _pool_take()
+    return g.db
+
+
+@app.teardown_appcontext
+def close_db(exc=None):
+    conn = g.pop("db", None)
+    if conn is None:
+        return
+    _pool_give(conn)
+
+
+# parse_resume is CPU-bound Python: run it in worker processes so the request
+# threads (index, /healthz, admin pages) keep the GIL while CVs parse, and a
+# multi-file upload parses its files in parallel. PARSE_WORKERS=0 parses inline.
+PARSE_WORKERS = int(os.environ.get("PARSE_WORKERS", "2"))
+_parse_pool = None
+_parse_pool_lock = threading.Lock()
+
+
+def _submit_parse(save_path: str, data: bytes) -> Future:
+    """parse_resume(save_path, data) as a Future (see PARSE_WORKERS)."""
+    if PARSE_WORKERS <= 0:
+        fut = Future()
+        try:
+            fut.set_result(parse_resume(save_path, data))
+        except Exception as e:
+            fut.set_exception(e)
+        return fut
+    pool = _get_parse_pool()
+    try:
+        return pool.submit(parse_resume, save_path, data)
+    except BrokenProcessPool:
+        # a worker died (PyMuPDF segfault, OOM kill) and took the pool with
+        # it; parses already queued on it fail through their callbacks
+        pass
+    try:
+        return _get_parse_pool(broken=pool).submit(parse_resume, save_path, data)
+    except BrokenProcessPool as e:
+        fut = Future()  # the caller's done-callback marks the row failed
+        fut.set_exception(e)
+        return fut
+
+
+def _get_parse_pool(broken=None) -> ProcessPoolExecutor:
+    """The shared parse pool, rebuilt when it is `broken`."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is not None and _parse_pool is broken:
+            _parse_pool.shutdown(wait=False, cancel_futures=True)
+            _parse_pool = None
+        if _parse_pool is None:
+            # spawn, not fork: forking a multi-threaded server process can
+            # inherit locks held by other threads
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=PARSE_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _parse_pool
+
+
+def _magic_ok(data: bytes, ext: str) -> bool:
+    """False when the bytes sniff as another type than `ext` (unknown passes)."""
+    if filetype is None:
+        return True
+    kind = filetype.guess(data[:261])
+    if kind is None:
+        return True
+    return kind.extension == ext or (ext == "docx" and kind.extension == "zip")
+
+
+def _remove_upload(path) -> None:
+    """Delete a stored CV; a missing file (or no path) is not an error."""
+    if not path:
+        return
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _dumps(value) -> str:
+    """JSON for the links/education/experience TEXT columns."""
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    # compact like orjson: same column text either way, and smaller rows
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _loads(value):
+    """Decode a JSON TEXT column; NULL/empty reads as []."""
+    if not value:
+        return []
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+def _candidate_fields(parsed: dict) -> tuple:
+    """
+    parse_resume() output -> candidates column values, in the order
+    name, first_name, middle_name, last_name, phone, email, links, education,
+    experience, skills, languages, raw_text (shared by upload and reupload_cv).
+    """
+    skills_val = parsed.get("skills", "")
+    if isinstance(skills_val, list):
+        skills_val = ", ".join(map(str, skills_val))
+
+    return (
+        parsed.get("name", ""),
+        parsed.get("first_name", ""),
+        parsed.get("middle_name", ""),
+        parsed.get("last_name", ""),
+        parsed.get("phone", ""),
+        parsed.get("email", ""),
+        _dumps(parsed.get("links", [])),
+        _dumps(parsed.get("education", [])),
+        _dumps(parsed.get("experience", [])),
+        skills_val,
+        "",  # languages aren't parsed; store empty (no list/JSON here)
+        parsed.get("raw_text", ""),
+    )
+
+
+def _store_parse(cand_id: int, fut: Future) -> None:
+    """
+    Done-callback of an upload's background parse: fill in the placeholder row
+    (status 'ready'), or mark it 'failed'. Runs outside any request, so it uses
+    get_conn() rather than get_db().
+    """
+    try:
+        fields, status = _candidate_fields(fut.result()), "ready"
+    except Exception as e:
+        app.logger.warning("parse failed for candidate %s: %s", cand_id, e)
+        fields, status = None, "failed"
+    # only a row still waiting on this parse is touched: a reupload_cv that
+    # finished in the meantime (status no longer 'parsing') wins
+    try:
+        with get_conn() as conn:
+            if fields is None:
+                conn.execute(
+                    "UPDATE candidates SET status=? WHERE id=? AND status='parsing'",
+                    (status, cand_id),
+                )
+            else:
+                conn.execute(
+                    """
+                    UPDATE candidates
+                    SET name=?, first_name=?, middle_name=?, last_name=?,
+                        phone=?, email=?, links=?, education=?, experience=?,
+                        skills=?, languages=?, raw_text=?, status=?
+                    WHERE id=? AND status='parsing'
+                    """,
+                    (*fields, status, cand_id),
+                )
+            conn.commit()
+    except sqlite3.Error:
+        # concurrent.futures swallows callback errors; log it here (the row
+        # stays 'parsing' until it is PARSE_STALE_S old, then reads as failed)
+        app.logger.exception("could not store parse result for candidate %s", cand_id)
+
+
+def _upload_ext(filename: str) -> str:
+    """Lower-cased extension without the dot ("" if none, like splitext for ".pdf")."""
+    head, dot, ext = filename.rpartition(".")
+    return ext.lower() if dot and head.strip(".") else ""
 
 
 def allowed_file(filename: str) -> bool:
-    return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTS
+    return _upload_ext(filename) in ALLOWED_EXTS
+
+
+def _upload_path(uid: int, filename: str, ext: str) -> str:
+    """uploads/<blake2b hex>.<ext>: a fresh name per upload, so re-uploading the
+    same file name never overwrites another CV (the original name is kept in
+    candidates.original_filename)."""
+    h = hashlib.blake2b(digest_size=12)
+    h.update(str(uid).encode())
+    h.update(filename.encode("utf-8", "ignore"))
+    h.update(os.urandom(8))
+    return os.path.join(UPLOAD_DIR, f"{h.hexdigest()}.{ext}")
 
 
 def current_user():
     uid = session.get("user_id")
     if not uid:
         return None
-    conn = sqlite3.connect(DB_PATH)
+    # one users lookup per request: cached on g, keyed by uid so a login/logout
+    # earlier in the same request is still honoured
+    cached = g.get("user")
+    if cached is not None and cached[0] == uid:
+        return cached[1]
+    conn = get_db()
     c = conn.cursor()
     c.execute("SELECT id, username, is_admin FROM users WHERE id=?", (uid,))
     row = c.fetchone()
-    conn.close()
-    if not row:
-        return None
-    return {"id": row[0], "username": row[1], "is_admin": bool(row[2])}
+    user = {"id": row[0], "username": row[1], "is_admin": bool(row[2])} if row else None
+    g.user = (uid, user)
+    return user
+
+
+# OWASP Argon2id profile: 3 passes over 64 MiB, 2 lanes
+_argon2 = (
+    PasswordHasher(time_cost=3, memory_cost=65536, parallelism=2, hash_len=32, salt_len=16)
+    if PasswordHasher is not None
+    else None
+)
+
+
+def _hash_password(password: str) -> str:
+    if _argon2 is not None:
+        return _argon2.hash(password)
+    return generate_password_hash(password, method=PASSWORD_HASH_METHOD)
+
+
+def _verify_password(stored: str, password: str) -> tuple:
+    """(matches, needs_rehash): needs_rehash is set when the stored hash is not
+    what _hash_password() would produce today (Argon2id params or Werkzeug method)."""
+    if stored.startswith("$argon2"):
+        if _argon2 is None:
+            return False, False
+        try:
+            _argon2.verify(stored, password)
+        except (VerificationError, InvalidHashError):
+            return False, False
+        return True, _argon2.check_needs_rehash(stored)
+    ok = check_password_hash(stored, password)
+    current = _argon2 is None and stored.startswith(_werkzeug_method() + "$")
+    return ok, ok and not current
+
+
+@lru_cache(maxsize=None)
+def _werkzeug_method() -> str:
+    """PASSWORD_HASH_METHOD as Werkzeug writes it into a hash: short forms
+    gain their defaults ("pbkdf2:sha256" -> "pbkdf2:sha256:1000000")."""
+    return generate_password_hash("", method=PASSWORD_HASH_METHOD).split("$", 1)[0]
+
+
+def _insert_reset_token(conn: sqlite3.Connection, uid: int, ttl: timedelta) -> str:
+    """Create a reset token for uid (dropping expired ones) and return it."""
+    now = datetime.now(timezone.utc)
+    conn.execute("DELETE FROM reset_tokens WHERE expires_at <= ?", (now.isoformat(),))
+    token = secrets.token_urlsafe(24)
+    conn.execute(
+        "INSERT INTO reset_tokens (user_id, token, expires_at) VALUES (?,?,?)",
+        (uid, _token_digest(token), (now + ttl).isoformat()),
+    )
+    return token
+
+
+def _token_digest(token: str) -> str:
+    """What reset_tokens.token stores: a leaked table holds no usable links."""
+    return hashlib.blake2b(token.encode(), digest_size=32).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _dummy_hash() -> str:
+    """Checked for unknown usernames so they cost the same as a wrong password
+    (built on first use: an Argon2 hash is too slow for import time)."""
+    return _hash_password(secrets.token_hex(8))
+
+
+_login_failures: dict = {}  # (username, remote addr) -> (failures, window start)
+_login_failures_lock = threading.Lock()
+
+
+def _login_throttled(key: tuple) -> bool:
+    now = time.monotonic()
+    with _login_failures_lock:
+        count, start = _login_failures.get(key, (0, now))
+        if now - start > LOGIN_FAILURE_WINDOW_S:
+            _login_failures.pop(key, None)
+            return False
+        return count >= LOGIN_MAX_FAILURES
+
+
+def _login_failed(key: tuple) -> None:
+    now = time.monotonic()
+    with _login_failures_lock:
+        count, start = _login_failures.get(key, (0, now))
+        if now - start > LOGIN_FAILURE_WINDOW_S:
+            count, start = 0, now
+        _login_failures[key] = (count + 1, start)
+        if len(_login_failures) > 1024:  # drop expired windows
+            for k, (_, t) in list(_login_failures.items()):
+                if now - t > LOGIN_FAILURE_WINDOW_S:
+                    del _login_failures[k]
 
 
 def login_required(fn):
@@ -129,7 +603,9 @@ def admin_required(fn):
 
 @app.before_request
 def enforce_idle_timeout():
-    now = datetime.now(timezone.utc).timestamp()
+    if request.endpoint in ("healthz", "static"):
+        return
+    now = time.time()
     last = session.get("last_seen")
     if session.get("user_id"):
         if last and (now - last) > (IDLE_TIMEOUT_MIN * 60):
@@ -137,7 +613,8 @@ def enforce_idle_timeout():
             session.clear()
             flash("You were logged out due to inactivity.", "info")
             return redirect(url_for("login"))
-        session["last_seen"] = now
+        if not last or (now - last) > LAST_SEEN_REFRESH_S:
+            session["last_seen"] = now
 
 
 @app.route("/signup", methods=["GET", "POST"])
@@ -148,30 +625,30 @@ def signup():
         if not username or not password:
             flash("Username and password are required.", "error")
             return redirect(url_for("signup"))
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db()
         c = conn.cursor()
         try:
+            # RETURNING hands back the new id: no second SELECT. Older SQLite
+            # libraries get it from lastrowid instead.
             c.execute(
-                "INSERT INTO users (username, password_hash, created_at) VALUES (?,?,?)",
+                "INSERT INTO users (username, password_hash, created_at) VALUES (?,?,?)"
+                + (" RETURNING id" if _SQLITE_RETURNING else ""),
                 (
                     username,
-                    generate_password_hash(password),
-                    datetime.now(timezone.utc).isoformat(),  # aware ISO8601
+                    _hash_password(password),
+                    _now_iso(),  # aware ISO8601
                 ),
             )
+            uid = c.fetchone()[0] if _SQLITE_RETURNING else c.lastrowid
             conn.commit()
         except sqlite3.IntegrityError:
-            conn.close()
             flash("Username already exists.", "error")
             return redirect(url_for("signup"))
         # Auto-login after signup
-        c.execute("SELECT id FROM users WHERE username=?", (username,))
-        uid = c.fetchone()[0]
-        conn.close()
         session.clear()
         session.permanent = True
         session["user_id"] = uid
-        session["last_seen"] = datetime.now(timezone.utc).timestamp()
+        session["last_seen"] = time.time()
         flash("Account created. Welcome!", "success")
         return redirect(url_for("index"))
     return render_template("auth_signup.html")
@@ -183,31 +660,43 @@ def login():
         username = (request.form.get("username") or "").strip()
         password = request.form.get("password") or ""
         next_url = request.args.get("next") or url_for("index")
+        throttle_key = (username, request.remote_addr or "")
+        if _login_throttled(throttle_key):
+            flash("Too many failed logins. Try again in a few minutes.", "error")
+            return redirect(url_for("login", next=next_url))
 
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db()
         c = conn.cursor()
         c.execute(
             "SELECT id, password_hash, is_admin, active FROM users WHERE username=?",
             (username,),
         )
         row = c.fetchone()
-        conn.close()
-
-        if not row or not check_password_hash(row[1], password):
-            import time
 
-            time.sleep(0.5)
+        ok, needs_rehash = _verify_password(row[1] if row else _dummy_hash(), password)
+        if not row or not ok:
+            _login_failed(throttle_key)
             flash("Invalid username or password.", "error")
             return redirect(url_for("login", next=next_url))
+        with _login_failures_lock:
+            _login_failures.pop(throttle_key, None)  # a good password resets the window
 
         if not row[3]:
             flash("Account is deactivated. Contact admin.", "error")
             return redirect(url_for("login", next=next_url))
 
+        if needs_rehash:
+            # upgrade older (pbkdf2/scrypt or weaker Argon2) hashes on login
+            c.execute(
+                "UPDATE users SET password_hash=? WHERE id=?",
+                (_hash_password(password), row[0]),
+            )
+            conn.commit()
+
         session.clear()
         session.permanent = True
         session["user_id"] = row[0]
-        session["last_seen"] = datetime.now(timezone.utc).timestamp()
+        session["last_seen"] = time.time()
         flash("Logged in successfully.", "success")
         return redirect(next_url)
     return render_template("auth_login.html", next=request.args.get("next"))
@@ -224,24 +713,16 @@ def logout():
 def reset_request():
     if request.method == "POST":
         username = (request.form.get("username") or "").strip()
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db()
         c = conn.cursor()
         c.execute("SELECT id FROM users WHERE username=?", (username,))
         row = c.fetchone()
         if not row:
-            conn.close()
             flash("If that account exists, a reset token was created.", "info")
             return redirect(url_for("reset_request"))
 
-        uid = row[0]
-        token = secrets.token_urlsafe(24)
-        expires = (datetime.now(timezone.utc) + timedelta(minutes=30)).isoformat()
-        c.execute(
-            "INSERT INTO reset_tokens (user_id, token, expires_at) VALUES (?,?,?)",
-            (uid, token, expires),
-        )
+        token = _insert_reset_token(conn, row[0], timedelta(minutes=30))
         conn.commit()
-        conn.close()
         # For demo: show token and direct link
         flash(f"Reset token: {token}", "info")
         flash("Use the link below within 30 minutes.", "info")
@@ -251,41 +732,39 @@ def reset_request():
 
 @app.route("/reset/<token>", methods=["GET", "POST"])
 def reset_form(token):
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_db()
     c = conn.cursor()
+    # used/expired tokens are filtered in SQL (expires_at is UTC ISO 8601, so
+    # the string comparison is chronological)
+    digest = _token_digest(token)
     c.execute(
-        "SELECT user_id, expires_at, used FROM reset_tokens WHERE token=?", (token,)
+        "SELECT user_id FROM reset_tokens WHERE token=? AND used=0 AND expires_at > ?",
+        (digest, _now_iso()),
     )
     row = c.fetchone()
     if not row:
-        conn.close()
         flash("Invalid or expired token.", "error")
         return redirect(url_for("reset_request"))
-    user_id, expires_at, used = row
-    if used:
-        conn.close()
-        flash("This token was already used.", "error")
-        return redirect(url_for("reset_request"))
-    if datetime.now(timezone.utc) > datetime.fromisoformat(expires_at):
-        conn.close()
-        flash("Token expired.", "error")
-        return redirect(url_for("reset_request"))
+    user_id = row[0]
 
     if request.method == "POST":
         pw = request.form.get("password") or ""
         if len(pw) < 6:
             flash("Password must be at least 6 characters.", "error")
             return redirect(url_for("reset_form", token=token))
+        # claim the token first: of two concurrent submits only one gets rowcount 1
+        c.execute("UPDATE reset_tokens SET used=1 WHERE token=? AND used=0", (digest,))
+        if c.rowcount != 1:
+            conn.rollback()
+            flash("Invalid or expired token.", "error")
+            return redirect(url_for("reset_request"))
         c.execute(
             "UPDATE users SET password_hash=? WHERE id=?",
-            (generate_password_hash(pw), user_id),
+            (_hash_password(pw), user_id),
         )
-        c.execute("UPDATE reset_tokens SET used=1 WHERE token=?", (token,))
         conn.commit()
-        conn.close()
         flash("Password updated. Please log in.", "success")
         return redirect(url_for("login"))
-    conn.close()
     return render_template("auth_reset_set.html", token=token)
 
 
@@ -298,39 +777,61 @@ def admin_home():
 @app.route("/admin/candidates")
 @admin_required
 def admin_candidates():
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_db()
     c = conn.cursor()
     c.execute("SELECT id, name, email, phone FROM candidates ORDER BY id DESC")
     rows = c.fetchall()
-    conn.close()
     return render_template("admin_candidates.html", rows=rows)
 
 
 @app.post("/admin/delete/candidate/<int:cand_id>")
 @admin_required
 def admin_delete_candidate(cand_id: int):
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_db()
     c = conn.cursor()
     c.execute("SELECT filepath FROM candidates WHERE id=?", (cand_id,))
     row = c.fetchone()
-    if row and row[0] and os.path.exists(row[0]):
-        try:
-            os.remove(row[0])
-        except Exception:
-            pass
     c.execute("DELETE FROM candidates WHERE id=?", (cand_id,))
     conn.commit()
-    conn.close()
+    if row:
+        _remove_upload(row[0])
+    return redirect(url_for("admin_candidates"))
 
 
 def init_db():
     with sqlite3.connect(DB_PATH) as conn:
+        # WAL is persistent in the db file: readers no longer block behind writers
+        conn.execute("PRAGMA journal_mode=WAL")
         conn.executescript(SCHEMA_SQL)
         c = conn.cursor()
 
+        # columns added after the first release (CREATE TABLE IF NOT EXISTS
+        # leaves existing tables alone)
+        cols = {r[1] for r in c.execute("PRAGMA table_info(candidates)")}
+        if "status" not in cols:
+            c.execute(
+                "ALTER TABLE candidates ADD COLUMN status TEXT NOT NULL DEFAULT 'ready'"
+            )
+        if "original_filename" not in cols:
+            c.execute("ALTER TABLE candidates ADD COLUMN original_filename TEXT")
+        # parses that were in flight when a previous process stopped will never
+        # report back. Only stale rows: with several gunicorn workers, another
+        # worker's current parses are still live.
+        c.execute(
+            "UPDATE candidates SET status='failed' WHERE status='parsing' AND created_at < ?",
+            (_iso_ago(PARSE_STALE_S),),
+        )
+        # backfill counts for databases that predate user_upload_counts (users
+        # that already have a row are maintained by the triggers)
+        c.execute(
+            """
+            INSERT OR IGNORE INTO user_upload_counts (user_id, n)
+            SELECT user_id, COUNT(*) FROM candidates GROUP BY user_id
+            """
+        )
+
         # ensure an admin user called 'admin' exists AND is admin+active
         from datetime import datetime, timezone
-        from werkzeug.security import generate_password_hash
 
         c.execute("SELECT id, is_admin, active FROM users WHERE username=?", ("admin",))
         row = c.fetchone()
@@ -342,10 +843,10 @@ def init_db():
                 """,
                 (
                     "admin",
-                    generate_password_hash("123"),
+                    _hash_password("123"),
                     1,
                     1,
-                    datetime.now(timezone.utc).isoformat(),
+                    _now_iso(),
                 ),
             )
         else:
@@ -361,28 +862,69 @@ def init_db():
 def index():
     # fetch list (OPTIONAL: show only the current user's CVs)
     uid = current_user()["id"]
-    conn = sqlite3.connect(DB_PATH)
+    page = max(request.args.get("page", 1, type=int), 1)
+    offset = (page - 1) * PAGE_SIZE
+    conn = get_db()
     c = conn.cursor()
     c.execute(
         """
         SELECT id, name, first_name, middle_name, last_name, phone, email, links,
-               education, experience, skills, languages
+               education, experience, skills, languages,
+               CASE WHEN status='parsing' AND created_at < ? THEN 'failed'
+                    ELSE status END
         FROM candidates
         WHERE user_id=?
         ORDER BY id DESC
+        LIMIT ? OFFSET ?
     """,
-        (uid,),
+        (_iso_ago(PARSE_STALE_S), uid, PAGE_SIZE + 1, offset),
     )
     rows = c.fetchall()
-    conn.close()
-    return render_template("index.html", candidates=rows, json=json, user=current_user())
+    # one extra row fetched tells us whether an older page exists
+    has_more = len(rows) > PAGE_SIZE
+    # decode the JSON columns (links, education, experience) here, once per row,
+    # rather than calling json.loads from inside the template
+    candidates = [
+        (*r[:7], _loads(r[7]), _loads(r[8]), _loads(r[9]), *r[10:])
+        for r in rows[:PAGE_SIZE]
+    ]
+    return render_template(
+        "index.html",
+        candidates=candidates,
+        user=current_user(),
+        page=page,
+        offset=offset,
+        has_more=has_more,
+    )
+
+
+@app.get("/status")
+@login_required
+def candidate_status():
+    """{id: status} for the current user's candidates in ?ids=1,2,3 (polled by
+    index.html while cards are still parsing; unknown ids are left out)."""
+    uid = current_user()["id"]
+    ids = [int(i) for i in request.args.get("ids", "").split(",") if i.isdigit()]
+    ids = ids[:PAGE_SIZE]
+    if not ids:
+        return jsonify({})
+    rows = get_db().execute(
+        f"""
+        SELECT id, CASE WHEN status='parsing' AND created_at < ? THEN 'failed'
+                        ELSE status END
+        FROM candidates
+        WHERE user_id=? AND id IN ({",".join("?" * len(ids))})
+        """,
+        (_iso_ago(PARSE_STALE_S), uid, *ids),
+    ).fetchall()
+    return jsonify({str(i): st for i, st in rows})
 
 
 @app.post("/update/<int:cand_id>")
 @login_required
 def update_candidate(cand_id: int):
     uid = current_user()["id"]
-    with sqlite3.connect(DB_PATH) as conn:
+    with get_db() as conn:
         c = conn.cursor()
         c.execute("SELECT user_id FROM candidates WHERE id=?", (cand_id,))
         row = c.fetchone()
@@ -396,13 +938,13 @@ def update_candidate(cand_id: int):
     last_name = payload.get("last_name", "")
     phone = payload.get("phone", "")
     email = payload.get("email", "")
-    links = json.dumps(payload.get("links", []), ensure_ascii=False)
-    education = json.dumps(payload.get("education", []), ensure_ascii=False)
-    experience = json.dumps(payload.get("experience", []), ensure_ascii=False)
+    links = _dumps(payload.get("links", []))
+    education = _dumps(payload.get("education", []))
+    experience = _dumps(payload.get("experience", []))
     skills = payload.get("skills", "")
     languages = payload.get("languages", "")
 
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_db()
     c = conn.cursor()
     c.execute(
         """UPDATE candidates SET
@@ -424,7 +966,6 @@ def update_candidate(cand_id: int):
         ),
     )
     conn.commit()
-    conn.close()
     return jsonify({"ok": True})
 
 
@@ -432,39 +973,50 @@ def update_candidate(cand_id: int):
 @admin_required
 def admin_cvs():
     base = UPLOAD_DIR
-    os.makedirs(base, exist_ok=True)
 
-    # 1) get files, newest first
-    files = [
-        (f, os.path.getmtime(os.path.join(base, f)))
-        for f in os.listdir(base)
-        if f.lower().endswith((".pdf", ".docx"))
-    ]
+    # 1) get files, newest first (scandir: one directory read, no path joins)
+    with os.scandir(base) as it:
+        files = [
+            (e.name, e.stat().st_mtime)
+            for e in it
+            if e.is_file() and e.name.lower().endswith((".pdf", ".docx"))
+        ]
     files.sort(key=lambda x: x[1], reverse=True)
-    files = [f for f, _ in files]
 
-    # 2) get candidates, newest first
-    conn = sqlite3.connect(DB_PATH)
+    # 2) get candidates, keyed by the file they were parsed from
+    conn = get_db()
     c = conn.cursor()
     c.execute(
-        "SELECT id, name, first_name, middle_name, last_name FROM candidates ORDER BY id DESC"
+        """
+        SELECT id, name, first_name, middle_name, last_name, original_filename, filepath
+        FROM candidates
+        """
     )
-    rows = c.fetchall()
-    conn.close()
+    by_file = {
+        os.path.basename(row[6]): row[:6] for row in c.fetchall() if row[6]
+    }
 
-    # 3) zip them
+    # 3) pair each file with its candidate row
     items = []
-    for i, fname in enumerate(files):
-        if i < len(rows):
-            cid, name, fn, mn, ln = rows[i]
+    for fname, _ in files:
+        row = by_file.get(fname)
+        if row:
+            cid, name, fn, mn, ln, original = row
             full = (
                 name
                 or " ".join([fn or "", mn or "", ln or ""]).strip()
                 or f"Candidate #{cid}"
             )
         else:
-            cid, full = None, "Unknown uploader"
-        items.append({"filename": fname, "candidate_id": cid, "display_name": full})
+            cid, full, original = None, "Unknown uploader", None
+        items.append(
+            {
+                "filename": fname,
+                "original_filename": original or fname,
+                "candidate_id": cid,
+                "display_name": full,
+            }
+        )
 
     return render_template("admin_cvs.html", items=items)
 
@@ -472,96 +1024,70 @@ def admin_cvs():
 @app.post("/upload")
 @login_required
 def upload():
-    f = request.files.get("file")
-    if not f:
+    # one or more files: each gets a placeholder row (status 'parsing') right away;
+    # the rows are filled in by _store_parse when their background parse finishes
+    files = [f for f in request.files.getlist("file") if f]
+    if not files:
         flash("No file")
         return redirect(url_for("index"))
 
-    # extension guard
-    ext = os.path.splitext(f.filename)[1].lower().lstrip(".")
-    if ext not in ALLOWED_EXTS:
-        flash("Unsupported file type")
-        return redirect(url_for("index"))
-
-    # save file: uploads/<userId>_<safe_name>
     uid = current_user()["id"]
-    safe_name = secure_filename(f.filename)
-    save_dir = UPLOAD_DIR
-    os.makedirs(save_dir, exist_ok=True)
-    save_path = os.path.join(save_dir, f"{uid}_{safe_name}")
-    f.save(save_path)
-
-    # parse resume
-    try:
-        parsed = parse_resume(save_path)
-    except Exception as e:
-        # cleanup on failure
-        try:
-            os.remove(save_path)
-        except Exception:
-            pass
-        flash(f"Parse failed: {e}")
+    saved = []
+    for f in files:
+        # extension guard
+        ext = _upload_ext(f.filename)
+        if ext not in ALLOWED_EXTS:
+            flash("Unsupported file type")
+            continue
+
+        save_path = _upload_path(uid, f.filename, ext)
+        # keep the bytes: the copy on disk is for downloads, parsing reads memory
+        data = f.read()
+        if not _magic_ok(data, ext):
+            flash("Unsupported file type")
+            continue
+        with open(save_path, "wb") as out:
+            out.write(data)
+        saved.append((save_path, f.filename, data))
+
+    if not saved:
         return redirect(url_for("index"))
 
-    # --- normalize fields for DB ---
-    links_json = json.dumps(parsed.get("links", []), ensure_ascii=False)
-    education_json = json.dumps(parsed.get("education", []), ensure_ascii=False)
-    experience_json = json.dumps(parsed.get("experience", []), ensure_ascii=False)
-
-    skills_val = parsed.get("skills", "")
-    if isinstance(skills_val, list):
-        skills_val = ", ".join(map(str, skills_val))
-
-    # you said you don't need to parse languages
-    languages_val = ""  # store empty; no list/JSON here
-
-    raw_text_val = parsed.get("raw_text", "")
-    now = datetime.now(timezone.utc).isoformat()
-
-    # insert
-    with sqlite3.connect(DB_PATH) as conn:
+    # insert the placeholders (committed before any parse can try to update them)
+    now = _now_iso()
+    jobs = []
+    with get_db() as conn:
         c = conn.cursor()
-        c.execute(
-            """
-            INSERT INTO candidates (
-              user_id, name, first_name, middle_name, last_name,
-              phone, email, links, education, experience,
-              skills, languages, raw_text, filepath, created_at
-            ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-            """,
-            (
-                uid,
-                parsed.get("name", ""),
-                parsed.get("first_name", ""),
-                parsed.get("middle_name", ""),
-                parsed.get("last_name", ""),
-                parsed.get("phone", ""),
-                parsed.get("email", ""),
-                links_json,
-                education_json,
-                experience_json,
-                skills_val,
-                languages_val,
-                raw_text_val,
-                save_path,
-                now,
-            ),
-        )
+        for save_path, original, data in saved:
+            c.execute(
+                """
+                INSERT INTO candidates
+                  (user_id, name, filepath, original_filename, created_at, status)
+                VALUES (?,?,?,?,?,'parsing')
+                """,
+                (uid, "", save_path, original, now),
+            )
+            jobs.append((c.lastrowid, save_path, data))
         conn.commit()
 
-    flash("CV uploaded")
+    # parse in the background; the request returns as soon as the jobs are queued
+    for cand_id, save_path, data in jobs:
+        _submit_parse(save_path, data).add_done_callback(
+            partial(_store_parse, cand_id)
+        )
+
+    flash("CV uploaded" if len(jobs) == 1 else f"{len(jobs)} CVs uploaded")
     return redirect(url_for("index"))
 
 
 def get_upload_counts():
-    with sqlite3.connect(DB_PATH) as conn:
+    with get_db() as conn:
         c = conn.cursor()
         rows = c.execute(
             """
-            SELECT u.id, u.username, u.active, u.is_admin, COUNT(c.id) AS uploads
+            SELECT u.id, u.username, u.active, u.is_admin, COALESCE(n.n, 0) AS uploads
             FROM users u
-            LEFT JOIN candidates c ON c.user_id = u.id
-            GROUP BY u.id, u.username, u.active, u.is_admin
+            LEFT JOIN user_upload_counts n ON n.user_id = u.id
             ORDER BY uploads DESC, u.username ASC
             """
         ).fetchall()
@@ -577,13 +1103,13 @@ def reupload_cv(cand_id: int):
         flash("No file to re-upload.", "error")
         return redirect(url_for("index"))
 
-    ext = os.path.splitext(f.filename)[1].lower().lstrip(".")
-    if ext not in {"pdf", "docx"}:
+    ext = _upload_ext(f.filename)
+    if ext not in ALLOWED_EXTS:
         flash("Unsupported file type", "error")
         return redirect(url_for("index"))
 
     # owner/admin check + get old filepath
-    with sqlite3.connect(DB_PATH) as conn:
+    with get_db() as conn:
         c = conn.cursor()
         c.execute("SELECT user_id, filepath FROM candidates WHERE id=?", (cand_id,))
         row = c.fetchone()
@@ -596,15 +1122,17 @@ def reupload_cv(cand_id: int):
             abort(403)
 
     # save new file
-    safe_name = secure_filename(f.filename)
-    save_dir =  UPLOAD_DIR
-    os.makedirs(save_dir, exist_ok=True)
-    save_path = os.path.join(save_dir, f"{uid}_{safe_name}")
-    f.save(save_path)
+    save_path = _upload_path(uid, f.filename, ext)
+    data = f.read()
+    if not _magic_ok(data, ext):
+        flash("Unsupported file type", "error")
+        return redirect(url_for("index"))
+    with open(save_path, "wb") as out:
+        out.write(data)
 
-    # parse
+    # parse (from memory; no re-read of the file just written)
     try:
-        parsed = parse_resume(save_path)
+        parsed = _submit_parse(save_path, data).result()
     except Exception as e:
         try:
             os.remove(save_path)
@@ -613,49 +1141,21 @@ def reupload_cv(cand_id: int):
         flash(f"Parse failed: {e}", "error")
         return redirect(url_for("index"))
 
-    # --- normalize fields for DB ---
-    links_json = json.dumps(parsed.get("links", []), ensure_ascii=False)
-    education_json = json.dumps(parsed.get("education", []), ensure_ascii=False)
-    experience_json = json.dumps(parsed.get("experience", []), ensure_ascii=False)
-
-    skills_val = parsed.get("skills", "")
-    if isinstance(skills_val, list):
-        skills_val = ", ".join(map(str, skills_val))
-
-    # you said you don't need to parse languages
-    languages_val = ""  # store empty; no list/JSON here
-
-    raw_text_val = parsed.get("raw_text", "")
-    now = datetime.now(timezone.utc).isoformat()
+    now = _now_iso()
 
     # update candidate
-    with sqlite3.connect(DB_PATH) as conn:
+    with get_db() as conn:
         c = conn.cursor()
         c.execute(
             """
             UPDATE candidates SET
               name=?, first_name=?, middle_name=?, last_name=?,
               phone=?, email=?, links=?, education=?, experience=?,
-              skills=?, languages=?, raw_text=?, filepath=?, created_at=?
+              skills=?, languages=?, raw_text=?, filepath=?, original_filename=?,
+              created_at=?, status='ready'
             WHERE id=?
             """,
-            (
-                parsed.get("name", ""),
-                parsed.get("first_name", ""),
-                parsed.get("middle_name", ""),
-                parsed.get("last_name", ""),
-                parsed.get("phone", ""),
-                parsed.get("email", ""),
-                links_json,
-                education_json,
-                experience_json,
-                skills_val,
-                languages_val,
-                raw_text_val,
-                save_path,
-                now,
-                cand_id,
-            ),
+            (*_candidate_fields(parsed), save_path, f.filename, now, cand_id),
         )
         conn.commit()
 
@@ -675,22 +1175,21 @@ def reupload_cv(cand_id: int):
 def account_delete():
     uid = current_user()["id"]
     pw = request.form.get("password") or ""
-    with sqlite3.connect(DB_PATH) as conn:
+    with get_db() as conn:
         c = conn.cursor()
         c.execute("SELECT password_hash FROM users WHERE id=?", (uid,))
         row = c.fetchone()
-        if not row or not check_password_hash(row[0], pw):
+        if not row or not _verify_password(row[0], pw)[0]:
             flash("Password incorrect.", "error")
             return redirect(url_for("index"))
         c.execute("SELECT filepath FROM candidates WHERE user_id=?", (uid,))
-        for (fp,) in c.fetchall():
-            if fp and os.path.exists(fp):
-                try:
-                    os.remove(fp)
-                except Exception:
-                    pass
+        paths = [fp for (fp,) in c.fetchall()]
+        # candidates (and reset tokens) go with the user via ON DELETE CASCADE
         c.execute("DELETE FROM users WHERE id=?", (uid,))
         conn.commit()
+    # files only after the commit: a failed commit leaves no rows without files
+    for fp in paths:
+        _remove_upload(fp)
     session.clear()
     flash("Account and all uploads deleted.", "success")
     return redirect(url_for("login"))
@@ -700,7 +1199,7 @@ def account_delete():
 @login_required
 def delete_cv(cand_id: int):
     uid = current_user()["id"]
-    with sqlite3.connect(DB_PATH) as conn:
+    with get_db() as conn:
         c = conn.cursor()
         c.execute("SELECT user_id, filepath FROM candidates WHERE id=?", (cand_id,))
         row = c.fetchone()
@@ -711,13 +1210,9 @@ def delete_cv(cand_id: int):
         u = current_user()
         if not (u["is_admin"] or owner_id == uid):
             abort(403)
-        if fpath and os.path.exists(fpath):
-            try:
-                os.remove(fpath)
-            except Exception:
-                pass
         c.execute("DELETE FROM candidates WHERE id=?", (cand_id,))
         conn.commit()
+    _remove_upload(fpath)
     flash(f"Deleted CV #{cand_id}.", "success")
     return redirect(url_for("index"))
 
@@ -732,13 +1227,33 @@ def admin_users():
 @app.route("/admin/cvs/<path:filename>")
 @admin_required
 def admin_download_cv(filename):
-    return send_from_directory(UPLOAD_DIR, filename, as_attachment=True)
+    # download under the name it was uploaded with, not the hashed storage name
+    row = get_db().execute(
+        "SELECT original_filename FROM candidates WHERE filepath=?",
+        (os.path.join(UPLOAD_DIR, filename),),
+    ).fetchone()
+    download_name = (row and row[0]) or os.path.basename(filename)
+    if X_ACCEL_PREFIX:
+        path = safe_join(UPLOAD_DIR, filename)
+        if path is None or not os.path.isfile(path):
+            abort(404)
+        resp = Response(mimetype="application/octet-stream")
+        resp.headers["X-Accel-Redirect"] = X_ACCEL_PREFIX.rstrip("/") + "/" + quote(filename)
+        if download_name.isascii():
+            disposition = {"filename": download_name}
+        else:
+            disposition = {"filename*": "UTF-8''" + quote(download_name, safe="")}
+        resp.headers.set("Content-Disposition", "attachment", **disposition)
+        return resp
+    return send_from_directory(
+        UPLOAD_DIR, filename, as_attachment=True, download_name=download_name
+    )
 
 
 @app.post("/admin/users/<int:uid>/deactivate")
 @admin_required
 def deactivate_user(uid: int):
-    with sqlite3.connect(DB_PATH) as conn:
+    with get_db() as conn:
         conn.execute("UPDATE users SET active=0 WHERE id=?", (uid,))
         conn.commit()
     flash(f"User #{uid} deactivated.", "success")
@@ -748,7 +1263,7 @@ def deactivate_user(uid: int):
 @app.post("/admin/users/<int:uid>/activate")
 @admin_required
 def activate_user(uid: int):
-    with sqlite3.connect(DB_PATH) as conn:
+    with get_db() as conn:
         conn.execute("UPDATE users SET active=1 WHERE id=?", (uid,))
         conn.commit()
     flash(f"User #{uid} activated.", "success")
@@ -758,13 +1273,8 @@ def activate_user(uid: int):
 @app.post("/admin/users/<int:uid>/reset")
 @admin_required
 def admin_reset_user(uid: int):
-    token = secrets.token_urlsafe(24)
-    expires = (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat()
-    with sqlite3.connect(DB_PATH) as conn:
-        conn.execute(
-            "INSERT INTO reset_tokens (user_id, token, expires_at) VALUES (?,?,?)",
-            (uid, token, expires),
-        )
+    with get_db() as conn:
+        token = _insert_reset_token(conn, uid, timedelta(hours=1))
         conn.commit()
     flash(f"Reset link: {url_for('reset_form', token=token, _external=False)}", "info")
     return redirect(url_for("admin_users"))
@@ -775,5 +1285,15 @@ def healthz():
 
 init_db()
 if __name__ == "__main__":
-
-    app.run(debug=False)
+    # Local run. Production goes through gunicorn (see Procfile); DEV=1 gives
+    # Flask's reloading debug server, otherwise use waitress (multi-threaded,
+    # also works on Windows) when it's installed (pip install waitress).
+    if os.environ.get("DEV", "0") == "1":
+        app.run(debug=True)
+    else:
+        try:
+            from waitress import serve
+        except ImportError:
+            app.run(debug=False, threaded=True)
+        else:
+            serve(app, host="127.0.0.1", port=5000, threads=8)
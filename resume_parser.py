@@ -1,19 +1,22 @@
 from __future__ import annotations
+import io
 import os
-from typing import Dict
+from typing import Dict, Optional
 
 from ats_parser import parse_file, adapt_for_backend
 
-def parse_resume(filepath: str) -> Dict:
+def parse_resume(filepath: str, data: Optional[bytes] = None) -> Dict:
     """
     Entry point that supports both PDF and DOCX.
     For PDF: identical behavior as before (parse_file -> adapt_for_backend).
     For DOCX: extracts text via python-docx, then tries ats_parser text pipeline.
+    If the caller already holds the file's bytes (e.g. a fresh upload), pass them
+    as data: they are parsed from memory and filepath only picks the format.
     """
     ext = os.path.splitext(filepath)[1].lower()
 
     if ext == ".pdf":
-        res = parse_file(filepath)
+        res = parse_file(data if data is not None else filepath)
         return adapt_for_backend(res)
 
     if ext == ".docx":
@@ -25,7 +28,7 @@ def parse_resume(filepath: str) -> Dict:
                 "python-docx is not installed. Run: pip install python-docx"
             ) from e
 
-        doc = Document(filepath)
+        doc = Document(io.BytesIO(data) if data is not None else filepath)
         text = "\n".join(p.text for p in doc.paragraphs).strip()
 
         try:
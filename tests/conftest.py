@@ -1,7 +1,11 @@
 # tests/conftest.py
+import importlib
+import sqlite3
 import sys
 import types
 
+import pytest
+
 # Pytest loads conftest before importing test modules.
 # This prevents import-time crashes if optional PDF libs are missing.
 
@@ -12,3 +16,22 @@ def _stub_module(name: str) -> None:
 # ats_parser/ingest.py imports these at import-time in some environments
 _stub_module("fitz")        # PyMuPDF (module name is fitz)
 _stub_module("pdfplumber")  # pdfplumber
+
+
+@pytest.fixture
+def backend_app(tmp_path, monkeypatch):
+    """A freshly imported backend on its own DB and upload dir, parsing inline."""
+    # backend runs init_db() at import time, so env must be set before importing
+    monkeypatch.setenv("DB_PATH", str(tmp_path / "test.db"))
+    monkeypatch.setenv("UPLOAD_DIR", str(tmp_path / "uploads"))
+    monkeypatch.setenv("PARSE_WORKERS", "0")  # parse inline, callbacks run immediately
+    sys.modules.pop("backend", None)
+    return importlib.import_module("backend")
+
+
+@pytest.fixture
+def backend_db(backend_app):
+    """A second connection to backend_app's database, for asserting on rows."""
+    db = sqlite3.connect(backend_app.DB_PATH)
+    yield db
+    db.close()
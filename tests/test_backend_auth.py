@@ -0,0 +1,65 @@
+# tests/test_backend_auth.py
+import pytest
+
+
+@pytest.fixture
+def client(backend_app):
+    return backend_app.app.test_client()
+
+
+def _login(client, username, password):
+    client.post("/login", data={"username": username, "password": password})
+    with client.session_transaction() as sess:
+        return sess.get("user_id")
+
+
+def test_failed_logins_only_throttle_the_targeted_username(backend_app, client):
+    assert client.post("/signup", data={"username": "ada", "password": "secret1"}).status_code == 302
+    client.get("/logout")
+
+    # every client shares one address behind a proxy
+    for _ in range(backend_app.LOGIN_MAX_FAILURES):
+        assert _login(client, "ada", "wrong") is None
+    assert _login(client, "ada", "secret1") is None  # ada is locked out...
+
+    assert _login(client, "admin", "123") is not None  # ...but admin is not
+
+
+def test_werkzeug_short_method_is_not_rehashed_every_login(backend_app, monkeypatch):
+    monkeypatch.setattr(backend_app, "_argon2", None)
+    monkeypatch.setattr(backend_app, "PASSWORD_HASH_METHOD", "pbkdf2:sha256")
+    backend_app._werkzeug_method.cache_clear()
+    stored = backend_app._hash_password("secret1")
+    assert stored.startswith("pbkdf2:sha256:")
+    assert backend_app._verify_password(stored, "secret1") == (True, False)
+    # a hash made under another method still gets upgraded
+    old = backend_app.generate_password_hash("secret1", method="scrypt")
+    assert backend_app._verify_password(old, "secret1") == (True, True)
+
+
+@pytest.mark.parametrize("returning", [True, False])
+def test_signup_logs_the_new_user_in(backend_app, backend_db, client, monkeypatch, returning):
+    monkeypatch.setattr(backend_app, "_SQLITE_RETURNING", returning)  # False: SQLite < 3.35
+    assert client.post("/signup", data={"username": "ada", "password": "secret1"}).status_code == 302
+    with client.session_transaction() as sess:
+        uid = sess["user_id"]
+    assert backend_db.execute("SELECT username FROM users WHERE id=?", (uid,)).fetchone() == ("ada",)
+
+
+def test_reset_token_is_stored_as_digest_and_single_use(backend_app, backend_db, client):
+    r = client.post("/reset/request", data={"username": "admin"})
+    token = r.headers["Location"].rsplit("/", 1)[1]
+    stored = [t for (t,) in backend_db.execute("SELECT token FROM reset_tokens")]
+    assert stored == [backend_app._token_digest(token)] and token not in stored
+    # a leaked digest is not a working link
+    assert client.get(f"/reset/{stored[0]}").headers["Location"].endswith("/reset/request")
+
+    r = client.post(f"/reset/{token}", data={"password": "newpass1"})
+    assert r.headers["Location"].endswith("/login")
+    assert _login(client, "admin", "newpass1") is not None
+    client.get("/logout")
+
+    # a second use is refused and the password stays as set
+    r = client.post(f"/reset/{token}", data={"password": "other12"})
+    assert r.headers["Location"].endswith("/reset/request")
+    assert _login(client, "admin", "other12") is None
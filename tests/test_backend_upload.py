@@ -0,0 +1,165 @@
+# tests/test_backend_upload.py
+import io
+import sqlite3
+from concurrent.futures import Future
+from pathlib import Path
+
+import pytest
+
+PDF = b"%PDF-1.4\n%fake\n"
+
+
+@pytest.fixture
+def app_env(backend_app, backend_db, monkeypatch):
+    backend = backend_app
+    seen = []  # row status observed while each parse runs
+
+    def fake_parse(path, data=None):
+        db = sqlite3.connect(backend.DB_PATH)
+        row = db.execute("SELECT status FROM candidates WHERE filepath=?", (path,)).fetchone()
+        seen.append(row and row[0])  # None for reupload_cv (row still has the old path)
+        db.close()
+        if b"broken" in data:
+            raise ValueError("broken pdf")
+        return {"name": "Ada Lovelace", "raw_text": "cv", "links": [], "education": [], "experience": []}
+
+    monkeypatch.setattr(backend, "parse_resume", fake_parse)
+    client = backend.app.test_client()
+    client.post("/login", data={"username": "admin", "password": "123"})
+    return backend, client, backend_db, seen
+
+
+def _rows(db):
+    return db.execute("SELECT id, name, status FROM candidates ORDER BY id").fetchall()
+
+
+def test_upload_inserts_placeholder_then_ready_or_failed(app_env):
+    backend, client, db, seen = app_env
+    r = client.post(
+        "/upload",
+        data={"file": [(io.BytesIO(PDF), "good.pdf"), (io.BytesIO(PDF + b"broken"), "bad.pdf")]},
+        content_type="multipart/form-data",
+    )
+    assert r.status_code == 302
+    # both rows existed as 'parsing' placeholders before their parse ran
+    assert seen == ["parsing", "parsing"]
+    assert _rows(db) == [(1, "Ada Lovelace", "ready"), (2, "", "failed")]
+
+
+def test_reupload_over_failed_row_marks_ready_and_wins_over_late_parse(app_env):
+    backend, client, db, seen = app_env
+    client.post("/upload", data={"file": (io.BytesIO(PDF + b"broken"), "bad.pdf")}, content_type="multipart/form-data")
+    assert _rows(db) == [(1, "", "failed")]
+
+    client.post("/reupload/1", data={"file": (io.BytesIO(PDF), "fixed.pdf")}, content_type="multipart/form-data")
+    assert _rows(db) == [(1, "Ada Lovelace", "ready")]
+
+    # a background parse finishing after the reupload must not overwrite it
+    late = Future()
+    late.set_result({"name": "Stale Result"})
+    backend._store_parse(1, late)
+    assert _rows(db) == [(1, "Ada Lovelace", "ready")]
+
+
+def test_init_db_fails_stale_parsing_rows(app_env):
+    backend, client, db, seen = app_env
+    db.execute(
+        "INSERT INTO candidates (user_id, name, created_at, status) VALUES "
+        "(1, '', '2000-01-01T00:00:00+00:00', 'parsing'), (1, '', ?, 'parsing')",
+        (backend._now_iso(),),
+    )
+    db.commit()
+    backend.init_db()
+    assert [s for _, _, s in _rows(db)] == ["failed", "parsing"]
+
+
+def test_broken_parse_pool_is_rebuilt(app_env, monkeypatch):
+    backend, client, db, seen = app_env
+
+    class FakePool:
+        def __init__(self, broken=False, **kwargs):
+            self.broken = broken
+
+        def submit(self, fn, *args):
+            if self.broken:
+                raise backend.BrokenProcessPool("a worker died")
+            fut = Future()
+            fut.set_result(fn(*args))
+            return fut
+
+        def shutdown(self, **kwargs):
+            pass
+
+    monkeypatch.setattr(backend, "PARSE_WORKERS", 2)
+    monkeypatch.setattr(backend, "ProcessPoolExecutor", FakePool)
+    monkeypatch.setattr(backend, "_parse_pool", FakePool(broken=True))
+    r = client.post("/upload", data={"file": (io.BytesIO(PDF), "good.pdf")}, content_type="multipart/form-data")
+    assert r.status_code == 302
+    assert _rows(db) == [(1, "Ada Lovelace", "ready")]
+    assert not backend._parse_pool.broken
+
+
+def test_admin_delete_candidate_removes_row_and_file(app_env):
+    backend, client, db, seen = app_env
+    client.post("/upload", data={"file": (io.BytesIO(PDF), "good.pdf")}, content_type="multipart/form-data")
+    (path,) = db.execute("SELECT filepath FROM candidates WHERE id=1").fetchone()
+    assert Path(path).exists()
+
+    r = client.post("/admin/delete/candidate/1")
+    assert r.status_code == 302 and r.headers["Location"].endswith("/admin/candidates")
+    assert _rows(db) == []
+    assert not Path(path).exists()
+
+
+def test_uploads_are_stored_hashed_and_downloaded_under_original_name(app_env):
+    backend, client, db, seen = app_env
+    for _ in range(2):
+        client.post("/upload", data={"file": (io.BytesIO(PDF), "My CV.pdf")}, content_type="multipart/form-data")
+    rows = db.execute("SELECT filepath, original_filename FROM candidates ORDER BY id").fetchall()
+    assert [orig for _, orig in rows] == ["My CV.pdf", "My CV.pdf"]
+    names = [Path(p).name for p, _ in rows]
+    # same upload name twice: two distinct hashed files, neither overwritten
+    assert names[0] != names[1]
+    assert all(n.endswith(".pdf") and "CV" not in n for n in names)
+    assert all(Path(p).read_bytes() == PDF for p, _ in rows)
+
+    r = client.get(f"/admin/cvs/{names[0]}")
+    assert r.status_code == 200 and r.data == PDF
+    assert 'filename="My CV.pdf"' in r.headers["Content-Disposition"]
+
+
+def test_upload_counts_follow_inserts_deletes_and_account_delete(app_env):
+    backend, client, db, seen = app_env
+
+    def counts():
+        return dict(db.execute("SELECT user_id, n FROM user_upload_counts").fetchall())
+
+    user = backend.app.test_client()
+    user.post("/signup", data={"username": "ada", "password": "secret1"})
+    (uid,) = db.execute("SELECT id FROM users WHERE username='ada'").fetchone()
+    for name in ("a.pdf", "b.pdf"):
+        user.post("/upload", data={"file": (io.BytesIO(PDF), name)}, content_type="multipart/form-data")
+    client.post("/upload", data={"file": (io.BytesIO(PDF), "c.pdf")}, content_type="multipart/form-data")
+    assert counts() == {uid: 2, 1: 1}
+
+    user.post("/cv/delete/1")
+    assert counts() == {uid: 1, 1: 1}
+
+    # the user's remaining candidates go via ON DELETE CASCADE
+    user.post("/account/delete", data={"password": "secret1"})
+    assert counts() == {1: 1}
+    assert db.execute("SELECT COUNT(*) FROM candidates WHERE user_id=?", (uid,)).fetchone() == (0,)
+
+
+def test_status_reports_only_the_users_rows(app_env):
+    backend, client, db, seen = app_env
+    db.execute(
+        "INSERT INTO candidates (user_id, name, created_at, status) VALUES (1, '', ?, 'parsing'), (2, '', ?, 'parsing')",
+        (backend._now_iso(), backend._now_iso()),
+    )
+    db.commit()
+    client.post("/upload", data={"file": (io.BytesIO(PDF), "good.pdf")}, content_type="multipart/form-data")
+    assert client.get("/status?ids=1,2,3,x").get_json() == {"1": "parsing", "3": "ready"}
+    assert client.get("/status").get_json() == {}
+    # the index no longer reloads itself while rows parse
+    assert b'http-equiv="refresh"' not in client.get("/").data
@@ -24,3 +24,9 @@ def test_extract_contacts_no_contacts_is_safe():
     assert c["phone"] == ""
     assert c["links"] == []
     assert c["name"] in ("",)
+
+
+def test_extract_contacts_phone_with_unicode_dashes():
+    # en dash / non-breaking hyphen separators, as Word and PDF text extraction emit them
+    for text in ("Tel: 514–555–1234", "Tel 514‑555‑1234"):
+        assert extract_contacts(text)["phone"] == "+1 514-555-1234"
@@ -53,3 +53,13 @@ Software Developer at Example Inc
 """
     sections = split_sections(text)
     assert sections["experience"].strip() != ""
+
+
+def test_multiword_heading_alias_goes_to_experience():
+    text = """
+Employment History
+Software Developer at Example Inc
+"""
+    sections = split_sections(text)
+    assert sections["experience"].strip() != ""
+    assert sections["other"].strip() == ""
@@ -29,3 +29,17 @@ Developer at X
 """
     out = extract_skills_from_text(text)
     assert "Python" in out and "SQL" in out and "Flask" in out
+
+
+def test_lexicon_label_is_the_leftmost_hit():
+    from ats_parser.rules import _lexicon_canon
+
+    assert _lexicon_canon("react.js") == "React"
+    assert _lexicon_canon("Django with Python") == "Django"
+    assert _lexicon_canon("Python with Django") == "Python"
+
+
+def test_allowlist_entry_beats_a_linguist_alias():
+    # Linguist lists "django" as an alias of the Jinja template language
+    assert extract_skills(["Django with Python"]) == ["Django"]
+    assert extract_skills(["Django, Bash, LaTeX"]) == ["Django", "Bash", "LaTeX"]
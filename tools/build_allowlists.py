@@ -7,9 +7,8 @@ from pathlib import Path
 
 def norm(s: str) -> str:
     """Normalize for matching (keep canonical casing elsewhere)."""
-    s = (s or "").strip()
-    s = s.replace("\u2013", "-").replace("\u2014", "-")  # en/em dash
-    s = re.sub(r"\s+", " ", s)
+    s = (s or "").replace("\u2013", "-").replace("\u2014", "-")  # en/em dash
+    s = " ".join(s.split())
     return s.lower()
 
 